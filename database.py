@@ -1,11 +1,49 @@
 import mysql.connector as connector
 from mysql.connector import Error
+from collections import OrderedDict
+from functools import wraps
+import threading
+
+
+def _serialized(method):
+    """Runs a DatabaseManager method while holding its connection lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class DatabaseManager:
     """
     Manages MySQL database connections and operations for the library system.
     """
+    # Rows per executemany() call; mysql.connector folds each chunk into one INSERT
+    BULK_CHUNK_SIZE = 1000
+
+    # Secondary indexes keyed by name: (table, column list)
+    INDEXES = {
+        "idx_loans_user_active": ("loans", "user_id, return_date"),
+        "idx_loans_book_active": ("loans", "book_id, return_date"),
+        "idx_loans_open_by_date": ("loans", "return_date, loan_date"),
+        # Let paged listings read rows in their default sort order
+        "idx_books_title": ("books", "title"),
+        "idx_users_full_name": ("users", "full_name"),
+    }
+
+    # Server-side prepared statements kept open, least recently used evicted first
+    PREPARED_CACHE_SIZE = 64
+
+    # Applied once to every new connection
+    SESSION_SETTINGS = (
+        # The connection is long-lived and reads never commit, so under the
+        # default REPEATABLE READ it would keep serving its first snapshot.
+        # READ COMMITTED gives every statement fresh data and skips gap locks.
+        "SET SESSION TRANSACTION ISOLATION LEVEL READ COMMITTED",
+        # Fail a blocked write quickly instead of freezing the caller for 50s
+        "SET SESSION innodb_lock_wait_timeout = 10",
+    )
+
     def __init__(self, host, database, user, password):
         """
         Initializes the DatabaseManager, connecting to MySQL database.
@@ -22,9 +60,14 @@ class DatabaseManager:
         self.password = password
         self.conn = None
         self.cursor = None
+        # The connection and cursor are shared, so calls from background
+        # workers and the GUI thread must not interleave
+        self.lock = threading.RLock()
+        self._prepared = OrderedDict()
         self._connect()
         self._create_database()
         self._create_tables()
+        self._create_indexes()
 
     def _connect(self):
         """Establishes a connection to the MySQL server."""
@@ -35,6 +78,8 @@ class DatabaseManager:
                 password=self.password
             )
             self.cursor = self.conn.cursor()
+            for statement in self.SESSION_SETTINGS:
+                self.cursor.execute(statement)
             print(f"Successfully connected to MySQL server: {self.host}")
         except Error as e:
             print(f"Database connection error: {e}")
@@ -102,7 +147,52 @@ class DatabaseManager:
         except Error as e:
             print(f"Error creating tables: {e}")
             self.conn.rollback()
+
+    def _create_indexes(self):
+        """Creates secondary indexes that are missing from the schema."""
+        if not self.conn:
+            print("Cannot create indexes: No database connection.")
+            return
+
+        try:
+            for index_name, (table, columns) in self.INDEXES.items():
+                self.cursor.execute(
+                    "SELECT 1 FROM information_schema.statistics "
+                    "WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s "
+                    "LIMIT 1",
+                    (table, index_name)
+                )
+                if self.cursor.fetchone():
+                    continue
+                self.cursor.execute(f"CREATE INDEX {index_name} ON {table} ({columns})")
+                print(f"Created index '{index_name}' on {table}.")
+        except Error as e:
+            print(f"Error creating indexes: {e}")
             
+    def _prepared_cursor(self, query):
+        """
+        Returns a prepared-statement cursor for a write query, preparing it
+        on the server only the first time the query text is seen.
+
+        Args:
+            query: SQL text with %s placeholders
+
+        Returns:
+            MySQLCursorPrepared: Cursor bound to the prepared statement
+        """
+        cursor = self._prepared.get(query)
+        if cursor is not None:
+            self._prepared.move_to_end(query)
+            return cursor
+        
+        cursor = self.conn.cursor(prepared=True)
+        self._prepared[query] = cursor
+        if len(self._prepared) > self.PREPARED_CACHE_SIZE:
+            _, evicted = self._prepared.popitem(last=False)
+            evicted.close()
+        return cursor
+
+    @_serialized
     def execute_query(self, query, params=()):
         """Executes a given SQL query with optional parameters."""
         if not self.conn:
@@ -117,6 +207,113 @@ class DatabaseManager:
             self.conn.rollback()
             return False
 
+    @_serialized
+    def execute_insert(self, query, params=()):
+        """
+        Executes an INSERT query and returns the generated id from the cursor.
+
+        Returns:
+            int or None: AUTO_INCREMENT id of the new row, or None on failure
+        """
+        if not self.conn:
+            print("No database connection available to execute query.")
+            return None
+        try:
+            cursor = self._prepared_cursor(query)
+            cursor.execute(query, params)
+            self.conn.commit()
+            return cursor.lastrowid
+        except Error as e:
+            print(f"Error executing query '{query}' with params {params}: {e}")
+            self.conn.rollback()
+            return None
+
+    @_serialized
+    def execute_update(self, query, params=()):
+        """
+        Executes a data-modifying query and reports how many rows it touched.
+
+        Returns:
+            int or None: Number of affected rows, or None on failure
+        """
+        if not self.conn:
+            print("No database connection available to execute query.")
+            return None
+        try:
+            cursor = self._prepared_cursor(query)
+            cursor.execute(query, params)
+            self.conn.commit()
+            return cursor.rowcount
+        except Error as e:
+            print(f"Error executing query '{query}' with params {params}: {e}")
+            self.conn.rollback()
+            return None
+
+    @_serialized
+    def execute_transaction(self, statements, prepared=True):
+        """
+        Executes several queries atomically with a single commit.
+
+        Args:
+            statements: Iterable of (query, params) or (query, params,
+                expected_rowcount) tuples. params may be a list of tuples, in
+                which case the query is run via executemany in chunks of
+                BULK_CHUNK_SIZE rows. If a statement affects a different number
+                of rows than its expected_rowcount, the whole transaction is
+                rolled back
+            prepared: Run single-row statements as cached prepared
+                statements. Pass False when the SQL text is built per call
+                (IN lists, CASE arms, multi-row VALUES), so one-off text is
+                not prepared and does not evict the fixed queries
+
+        Returns:
+            list or None: (rowcount, lastrowid) per statement, or None on failure
+        """
+        if not self.conn:
+            print("No database connection available to execute transaction.")
+            return None
+        query, params = None, ()
+        try:
+            results = []
+            for query, params, *expected in statements:
+                if isinstance(params, list):
+                    rowcount = 0
+                    for start in range(0, len(params), self.BULK_CHUNK_SIZE):
+                        self.cursor.executemany(query, params[start:start + self.BULK_CHUNK_SIZE])
+                        rowcount += self.cursor.rowcount
+                    results.append((rowcount, self.cursor.lastrowid))
+                else:
+                    cursor = self._prepared_cursor(query) if prepared else self.cursor
+                    cursor.execute(query, params)
+                    rowcount = cursor.rowcount
+                    results.append((rowcount, cursor.lastrowid))
+                if expected and rowcount != expected[0]:
+                    print(f"Rolling back transaction: query '{query}' affected "
+                          f"{rowcount} row(s), expected {expected[0]}")
+                    self.conn.rollback()
+                    return None
+            self.conn.commit()
+            return results
+        except Error as e:
+            print(f"Error executing transaction at query '{query}' with params {params}: {e}")
+            self.conn.rollback()
+            return None
+
+    def chunks(self, values):
+        """
+        Splits a list of values into BULK_CHUNK_SIZE slices for IN (...) clauses.
+
+        Args:
+            values: List of parameter values
+
+        Returns:
+            list: Consecutive slices of values
+        """
+        values = list(values)
+        return [values[start:start + self.BULK_CHUNK_SIZE]
+                for start in range(0, len(values), self.BULK_CHUNK_SIZE)]
+
+    @_serialized
     def fetch_one(self, query, params=()):
         """Fetches a single row from the database."""
         if not self.conn:
@@ -129,6 +326,7 @@ class DatabaseManager:
             print(f"Error fetching one from query '{query}' with params {params}: {e}")
             return None
 
+    @_serialized
     def fetch_all(self, query, params=()):
         """Fetches all rows from the database."""
         if not self.conn:
@@ -141,8 +339,12 @@ class DatabaseManager:
             print(f"Error fetching all from query '{query}' with params {params}: {e}")
             return None
 
+    @_serialized
     def close(self):
         """Closes the database connection."""
+        for cursor in self._prepared.values():
+            cursor.close()
+        self._prepared.clear()
         if self.cursor:
             self.cursor.close()
         if self.conn:
@@ -3,7 +3,7 @@ from pathlib import Path
 from PySide6.QtWidgets import QApplication, QStackedWidget, QMessageBox, QSizePolicy
 from PySide6.QtGui import QIcon
 from PySide6.QtCore import Qt
-from screens.auth.welcome import WelcomeScreen  
+from screens.auth.welcome import WelcomeScreen, preload_welcome_assets
 from screens.auth.login import LoginScreen
 from screens.auth.register import RegisterScreen
 from screens.reader.dashboard import ReaderDashboard
@@ -21,6 +21,8 @@ class LibraryApp:
     """
     def __init__(self):
         self.app = QApplication(sys.argv)
+        # Decode the welcome screen's icons while the database is set up
+        preload_welcome_assets()
         self.current_user = None
         self.user_type = None
         self.style_manager = StyleManager()
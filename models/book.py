@@ -5,12 +5,46 @@ import shutil
 from pathlib import Path
 
 
+def _note_change(book, name, value):
+    """Bump Book.revision if an existing book's indexed field is changing."""
+    values = book.__dict__
+    if name in values and values[name] != value:
+        Book.revision += 1
+
+
+class _IndexedField:
+    """Plain attribute of a Book whose changes are tracked in Book.revision."""
+    
+    def __set_name__(self, owner, name):
+        self.name = "_" + name
+    
+    def __get__(self, book, owner=None):
+        if book is None:
+            return self
+        try:
+            return book.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name[1:]) from None
+    
+    def __set__(self, book, value):
+        _note_change(book, self.name, value)
+        book.__dict__[self.name] = value
+
+
 class Book:
     """
     Book model for handling book-related database operations.
     Represents books in the library management system.
     """
     
+    # Bumped whenever a field BookIndex snapshots changes on an existing
+    # book, so an index built before the change is no longer trusted
+    revision = 0
+    
+    genre = _IndexedField()
+    publication_year = _IndexedField()
+    available_copies = _IndexedField()
+    
     def __init__(self, book_id=None, title=None, author=None, isbn=None, 
                  genre=None, publication_year=None, total_copies=1, 
                  available_copies=None, image_path=None, created_at=None):
@@ -39,6 +73,46 @@ class Book:
         self.available_copies = available_copies if available_copies is not None else total_copies
         self.image_path = image_path
         self.created_at = created_at or datetime.now().isoformat()
+        self._search_key = None
+        self._search_blob = ""
+    
+    @property
+    def title(self):
+        """Title of the book."""
+        return self._title
+    
+    @title.setter
+    def title(self, value):
+        # Lowercased copy kept alongside so sorts can use attrgetter('title_lc')
+        _note_change(self, "_title", value)
+        self._title = value
+        self.title_lc = (value or "").lower()
+    
+    @property
+    def author(self):
+        """Author of the book."""
+        return self._author
+    
+    @author.setter
+    def author(self, value):
+        _note_change(self, "_author", value)
+        self._author = value
+        self.author_lc = (value or "").lower()
+    
+    @property
+    def search_blob(self):
+        """
+        Lowercased title, author, genre and year joined by NUL separators.
+        Rebuilt only when one of those fields has changed.
+        """
+        key = (self.title, self.author, self.genre, self.publication_year)
+        if key != self._search_key:
+            self._search_key = key
+            year = str(self.publication_year) if self.publication_year is not None else ""
+            self._search_blob = "\0".join(
+                (self.title or "", self.author or "", self.genre or "", year)
+            ).lower()
+        return self._search_blob
     
     def validate(self):
         """
@@ -110,19 +184,65 @@ class Book:
                                  total_copies, available_copies, image_path)
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
             """
-            success = get_db().execute_query(
+            new_id = get_db().execute_insert(
                 query, 
                 (self.title, self.author, self.isbn, self.genre, 
                  self.publication_year, self.total_copies, 
                  self.available_copies, self.image_path)
             )
             
-            if success:
-                self.id = get_db().fetch_one("SELECT LAST_INSERT_ID()")[0]
+            if new_id is not None:
+                self.id = new_id
                 return True, self.id
             else:
                 return False, "Failed to create book"
     
+    @classmethod
+    def save_many(cls, books):
+        """
+        Insert several new books in a single transaction and set their ids.
+        
+        Args:
+            books (list): Unsaved Book objects
+            
+        Returns:
+            tuple: (success, inserted_count_or_error_message)
+        """
+        rows = []
+        for book in books:
+            is_valid, errors = book.validate()
+            if not is_valid:
+                return False, f"{book.title or 'Untitled book'}: {'; '.join(errors)}"
+            rows.append((book.title, book.author, book.isbn or None, book.genre,
+                         book.publication_year, book.total_copies,
+                         book.available_copies, book.image_path))
+        
+        if not rows:
+            return True, 0
+        
+        # One multi-row INSERT per chunk; InnoDB gives a simple insert
+        # consecutive ids starting at the lastrowid it reports
+        db = get_db()
+        book_chunks = db.chunks(books)
+        statements = []
+        for chunk, row_chunk in zip(book_chunks, db.chunks(rows)):
+            values = ", ".join(["(%s, %s, %s, %s, %s, %s, %s, %s)"] * len(chunk))
+            statements.append((
+                "INSERT INTO books (title, author, isbn, genre, publication_year, "
+                f"total_copies, available_copies, image_path) VALUES {values}",
+                tuple(value for row in row_chunk for value in row),
+                len(chunk)
+            ))
+        results = db.execute_transaction(statements, prepared=False)
+        
+        if results is None:
+            return False, "Failed to create books"
+        
+        for chunk, (_, first_id) in zip(book_chunks, results):
+            for offset, book in enumerate(chunk):
+                book.id = first_id + offset
+        return True, len(books)
+    
     @classmethod
     def find_by_id(cls, book_id):
         """
@@ -191,7 +311,8 @@ class Book:
         Search for books with various filters.
         
         Args:
-            query (str): General search query (title, author, genre)
+            query (str): General search query (title, author, genre, year);
+                every whitespace-separated word must match
             genre (str): Specific genre filter
             author (str): Specific author filter
             available_only (bool): Only return available books
@@ -208,10 +329,13 @@ class Book:
         conditions = []
         params = []
         
-        if query:
-            conditions.append("(title LIKE %s OR author LIKE %s OR genre LIKE %s)")
-            search_param = f"%{query}%"
-            params.extend([search_param, search_param, search_param])
+        for token in (query or "").split():
+            conditions.append(
+                "(title LIKE %s OR author LIKE %s OR genre LIKE %s "
+                "OR CAST(publication_year AS CHAR) LIKE %s)"
+            )
+            search_param = f"%{token}%"
+            params.extend([search_param, search_param, search_param, search_param])
         
         if genre:
             conditions.append("genre LIKE %s")
@@ -287,6 +411,103 @@ class Book:
         
         return books
     
+    @classmethod
+    def page(cls, limit=50, offset=0, order_by="title", descending=False,
+             genre=None, available_only=False, after_id=None):
+        """
+        Get one page of books, sorted and filtered in SQL.
+        
+        Args:
+            limit (int): Maximum number of books to return
+            offset (int): Number of books to skip
+            order_by (str): Column to order by
+            descending (bool): Sort in descending order
+            genre (str): Only return books of this genre
+            available_only (bool): Only return available books
+            after_id (int): Keyset cursor; when given, returns the books with
+                the next higher IDs in ID order and ignores offset/order_by
+            
+        Returns:
+            list: List of Book objects
+        """
+        valid_order_columns = ["title", "author", "genre", "publication_year", "available_copies", "id"]
+        if order_by not in valid_order_columns:
+            order_by = "title"
+        
+        conditions = []
+        params = []
+        
+        if genre:
+            conditions.append("genre = %s")
+            params.append(genre)
+        
+        if available_only:
+            conditions.append("available_copies > 0")
+        
+        if after_id is not None:
+            conditions.append("id > %s")
+            params.append(after_id)
+            order_clause = "id"
+        else:
+            direction = "DESC" if descending else "ASC"
+            order_clause = f"{order_by} {direction}, id {direction}"
+        
+        query = """
+            SELECT id, title, author, isbn, genre, publication_year,
+                   total_copies, available_copies, image_path
+            FROM books
+        """
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {order_clause} LIMIT %s"
+        params.append(limit)
+        if after_id is None:
+            query += " OFFSET %s"
+            params.append(offset)
+        
+        books_data = get_db().fetch_all(query, params)
+        
+        books = []
+        for book_data in books_data or []:
+            books.append(cls(
+                book_id=book_data[0],
+                title=book_data[1],
+                author=book_data[2],
+                isbn=book_data[3],
+                genre=book_data[4],
+                publication_year=book_data[5],
+                total_copies=book_data[6],
+                available_copies=book_data[7],
+                image_path=book_data[8]
+            ))
+        
+        return books
+    
+    @classmethod
+    def iter_all(cls, batch_size=256, genre=None, available_only=False):
+        """
+        Yield every book in ID order, fetching batch_size rows at a time.
+        
+        Each batch is its own keyset query, so the shared connection is free
+        for other statements while the caller works through the books.
+        
+        Args:
+            batch_size (int): Number of rows per query
+            genre (str): Only yield books of this genre
+            available_only (bool): Only yield available books
+            
+        Yields:
+            Book: Book objects
+        """
+        last_id = 0
+        while True:
+            batch = cls.page(limit=batch_size, genre=genre,
+                             available_only=available_only, after_id=last_id)
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            last_id = batch[-1].id
+    
     def delete(self):
         """
         Delete the book from the database.
@@ -297,13 +518,17 @@ class Book:
         if not self.id:
             return False, "Cannot delete book without ID"
         
-        active_loans = get_db().fetch_one(
-            "SELECT COUNT(*) FROM loans WHERE book_id = %s AND return_date IS NULL",
-            (self.id,)
-        )[0]
+        deleted = get_db().execute_update(
+            "DELETE FROM books WHERE id = %s AND NOT EXISTS ("
+            "SELECT 1 FROM loans WHERE book_id = %s AND return_date IS NULL)",
+            (self.id, self.id)
+        )
         
-        if active_loans > 0:
-            return False, f"Cannot delete book with {active_loans} active loans"
+        if not deleted:
+            active_loans = self.get_active_loans_count() if deleted == 0 else 0
+            if active_loans > 0:
+                return False, f"Cannot delete book with {active_loans} active loans"
+            return False, "Failed to delete book"
         
         if self.image_path and os.path.exists(self.image_path):
             try:
@@ -311,8 +536,65 @@ class Book:
             except Exception as e:
                 print(f"Warning: Could not delete image file {self.image_path}: {e}")
         
-        success = get_db().execute_query("DELETE FROM books WHERE id = %s", (self.id,))
-        return success, "Book deleted successfully" if success else "Failed to delete book"
+        return True, "Book deleted successfully"
+    
+    @classmethod
+    def delete_many(cls, book_ids):
+        """
+        Delete several books in one transaction, skipping any with loan history.
+        
+        Loans reference books without ON DELETE, so the DELETE itself leaves
+        out every book that any loan points at, returned or not; one such book
+        no longer fails the whole batch.
+        
+        Args:
+            book_ids (list): IDs of the books to delete
+            
+        Returns:
+            tuple: (success, deleted_count_or_error_message)
+        """
+        db = get_db()
+        chunks = db.chunks(book_ids)
+        if not chunks:
+            return True, 0
+        
+        image_paths = {}
+        for chunk in chunks:
+            placeholders = ", ".join(["%s"] * len(chunk))
+            image_paths.update(db.fetch_all(
+                f"SELECT id, image_path FROM books WHERE id IN ({placeholders})",
+                tuple(chunk)
+            ) or [])
+        
+        statements = []
+        for chunk in chunks:
+            placeholders = ", ".join(["%s"] * len(chunk))
+            statements.append((
+                f"DELETE FROM books WHERE id IN ({placeholders}) AND NOT EXISTS ("
+                "SELECT 1 FROM loans WHERE loans.book_id = books.id)",
+                tuple(chunk)
+            ))
+        
+        results = db.execute_transaction(statements, prepared=False)
+        if results is None:
+            return False, "Failed to delete books"
+        
+        # Only remove the covers of books that are actually gone
+        for chunk in chunks:
+            placeholders = ", ".join(["%s"] * len(chunk))
+            for (book_id,) in db.fetch_all(
+                f"SELECT id FROM books WHERE id IN ({placeholders})", tuple(chunk)
+            ) or []:
+                image_paths.pop(book_id, None)
+        
+        for image_path in image_paths.values():
+            if image_path and os.path.exists(image_path):
+                try:
+                    os.remove(image_path)
+                except Exception as e:
+                    print(f"Warning: Could not delete image file {image_path}: {e}")
+        
+        return True, sum(rowcount for rowcount, _ in results)
     
     def is_available(self):
         """
@@ -359,6 +641,41 @@ class Book:
         
         return success, "Book returned successfully" if success else "Failed to update book availability"
     
+    @classmethod
+    def bulk_adjust_availability(cls, changes):
+        """
+        Adjust the available copies of several books in one transaction.
+        
+        The bounds are checked by the UPDATE itself, so a concurrent checkout
+        or return cannot push a count below 0 or above total_copies. If any
+        book is missing or would go out of bounds, nothing is changed.
+        
+        Args:
+            changes (dict): Mapping of book ID to the change in available copies
+            
+        Returns:
+            bool: True if every book was updated, False otherwise
+        """
+        changes = {book_id: change for book_id, change in changes.items() if change}
+        if not changes:
+            return True
+        
+        db = get_db()
+        statements = []
+        for chunk in db.chunks(changes):
+            cases = " ".join(["WHEN %s THEN %s"] * len(chunk))
+            case_params = [value for book_id in chunk for value in (book_id, changes[book_id])]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            statements.append((
+                f"UPDATE books SET available_copies = available_copies + CASE id {cases} END "
+                f"WHERE id IN ({placeholders}) "
+                f"AND available_copies + CASE id {cases} END BETWEEN 0 AND total_copies",
+                tuple(case_params + chunk + case_params),
+                len(chunk)
+            ))
+        
+        return db.execute_transaction(statements, prepared=False) is not None
+    
     def save_image(self, source_path, book_covers_dir=None):
         """
         Save book cover image to the appropriate directory.
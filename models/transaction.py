@@ -1,9 +1,52 @@
 from database import get_db
+from collections import Counter
 from datetime import datetime, timedelta, date
 from models.book import Book
 from models.user import User
 
 
+# Availability is adjusted in SQL so it can share the loan statement's transaction
+CHECKOUT_BOOK_QUERY = (
+    "UPDATE books SET available_copies = available_copies - 1 "
+    "WHERE id = %s AND available_copies > 0"
+)
+RETURN_BOOK_QUERY = (
+    "UPDATE books SET available_copies = available_copies + 1 "
+    "WHERE id = %s AND available_copies < total_copies"
+)
+# Gives back the copy of a loan only while that loan is still open in the database
+RETURN_OPEN_LOAN_COPY_QUERY = (
+    "UPDATE books b JOIN loans l ON l.book_id = b.id "
+    "SET b.available_copies = b.available_copies + 1 "
+    "WHERE l.id = %s AND l.return_date IS NULL AND b.available_copies < b.total_copies"
+)
+
+# WHERE clauses for loan status filters, written against the alias "l".
+# Dates are compared against l.loan_date directly so the (return_date, loan_date)
+# index can be used as a range scan.
+STATUS_CONDITIONS = {
+    "active": "l.return_date IS NULL AND l.loan_date >= DATE_SUB(CURDATE(), INTERVAL 14 DAY)",
+    "returned": "l.return_date IS NOT NULL",
+    "overdue": "l.return_date IS NULL AND l.loan_date < DATE_SUB(CURDATE(), INTERVAL 14 DAY)",
+    "unreturned": "l.return_date IS NULL",
+}
+
+# SQL counterpart of update_status(), so loans can be sorted and searched by status
+STATUS_EXPRESSION = (
+    "(CASE WHEN l.return_date IS NOT NULL THEN 'returned' "
+    "WHEN CURDATE() > DATE_ADD(l.loan_date, INTERVAL 14 DAY) THEN 'overdue' "
+    "ELSE 'active' END)"
+)
+
+# ORDER BY expressions for the sort keys offered by SearchRecordsModule.sort_loans.
+# The due date is always loan_date + 14 days, so it sorts the same as loan_date.
+LOAN_ORDER_COLUMNS = {
+    "loan_date": "l.loan_date",
+    "due_date": "l.loan_date",
+    "status": STATUS_EXPRESSION,
+}
+
+
 class Transaction:
     """
     Transaction model for handling loan-related database operations.
@@ -12,9 +55,10 @@ class Transaction:
     
     def __init__(self, transaction_id=None, book_id=None, user_id=None, 
                  loan_date=None, return_date=None, due_date=None, 
-                 fine_amount=0.0, status="active"):
+                 fine_amount=0.0, status=None):
         """
         Initialize a Transaction (Loan) object.
+        The status is derived from the dates unless given explicitly.
         """
         self.id = transaction_id
         self.book_id = book_id
@@ -26,9 +70,40 @@ class Transaction:
         
         self.fine_amount = fine_amount
         self.status = status
+        if status is None:
+            self.update_status()
         
         self._book = None
         self._user = None
+        self._search_key = None
+        self._search_blob = ""
+    
+    @property
+    def details_loaded(self):
+        """Whether the book and borrower are already loaded, e.g. by get_all_loans_joined."""
+        return self._book is not None and self._user is not None
+    
+    @property
+    def search_blob(self):
+        """
+        Lowercased book title, borrower, status and dates joined by NUL
+        separators. Rebuilt only when one of those values has changed.
+        Uses only the book and borrower already loaded and never queries;
+        search_loans sends lists without them to the database instead.
+        """
+        book = self._book
+        user = self._user
+        key = (
+            book.title if book else "",
+            user.username if user else "",
+            self.status,
+            self.loan_date or "",
+            self.due_date or ""
+        )
+        if key != self._search_key:
+            self._search_key = key
+            self._search_blob = "\0".join(key).lower()
+        return self._search_blob
     
     def _convert_date_to_string(self, date_value):
         """Convert date object to string format, or return as-is if already string or None."""
@@ -70,24 +145,25 @@ class Transaction:
         if not self.loan_date:
             errors.append("Loan date is required")
         
+        # Book, user and duplicate-loan lookups share a single round trip
+        available_copies, user_exists, has_open_loan = get_db().fetch_one(
+            "SELECT (SELECT available_copies FROM books WHERE id = %s), "
+            "EXISTS(SELECT 1 FROM users WHERE id = %s), "
+            "EXISTS(SELECT 1 FROM loans WHERE user_id = %s AND book_id = %s AND return_date IS NULL)",
+            (self.book_id, self.user_id, self.user_id, self.book_id)
+        ) or (None, 0, 0)
+        
         if not self.id:
-            book = Book.find_by_id(self.book_id)
-            if not book:
+            if available_copies is None:
                 errors.append("Book not found")
-            elif not book.is_available():
+            elif available_copies <= 0:
                 errors.append("Book is not available for checkout")
         
-        user = User.find_by_id(self.user_id)
-        if not user:
+        if not user_exists:
             errors.append("User not found")
         
-        if not self.id:
-            existing_loan = get_db().fetch_one(
-                "SELECT id FROM loans WHERE user_id = %s AND book_id = %s AND return_date IS NULL",
-                (self.user_id, self.book_id)
-            )
-            if existing_loan:
-                errors.append("User already has this book checked out")
+        if not self.id and has_open_loan:
+            errors.append("User already has this book checked out")
         
         return len(errors) == 0, errors
     
@@ -117,20 +193,126 @@ class Transaction:
                 INSERT INTO loans (book_id, user_id, loan_date, return_date)
                 VALUES (%s, %s, %s, %s)
             """
-            success = get_db().execute_query(
-                query, 
-                (self.book_id, self.user_id, self.loan_date, self.return_date)
-            )
+            results = get_db().execute_transaction([
+                (query, (self.book_id, self.user_id, self.loan_date, self.return_date)),
+                # Rolls the INSERT back if another checkout took the last copy
+                (CHECKOUT_BOOK_QUERY, (self.book_id,), 1)
+            ])
             
-            if success:
-                self.id = get_db().fetch_one("SELECT LAST_INSERT_ID()")[0]
-                book = Book.find_by_id(self.book_id)
-                if book:
-                    book.checkout()
+            if results:
+                self.id = results[0][1]
                 return True, self.id
             else:
                 return False, "Failed to create transaction"
     
+    @classmethod
+    def save_many(cls, transactions):
+        """
+        Insert several new loans and reserve their copies in a single transaction.
+        
+        Every loan gets the checks validate() runs for a single save: the book
+        and user exist, an open loan has a copy to take, and the user does not
+        already have the book checked out. The copies are reserved by an
+        UPDATE that only succeeds while stock lasts, so a concurrent checkout
+        cannot drive a count negative. On success each Transaction's id is set.
+        
+        Args:
+            transactions (list): Unsaved Transaction objects
+            
+        Returns:
+            tuple: (success, inserted_count_or_error_message)
+        """
+        if not transactions:
+            return True, 0
+        
+        copies_needed = Counter()
+        open_pairs = set()
+        for transaction in transactions:
+            if not transaction.book_id or not transaction.user_id or not transaction.loan_date:
+                return False, "Book ID, user ID and loan date are required for every loan"
+            if not transaction.return_date:
+                pair = (transaction.user_id, transaction.book_id)
+                if pair in open_pairs:
+                    return False, f"User {pair[0]} would check out book {pair[1]} twice"
+                open_pairs.add(pair)
+                copies_needed[transaction.book_id] += 1
+        
+        db = get_db()
+        book_ids = {transaction.book_id for transaction in transactions}
+        user_ids = {transaction.user_id for transaction in transactions}
+        
+        available = {}
+        for chunk in db.chunks(book_ids):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            available.update(db.fetch_all(
+                f"SELECT id, available_copies FROM books WHERE id IN ({placeholders})",
+                tuple(chunk)
+            ) or [])
+        for book_id in book_ids:
+            if book_id not in available:
+                return False, f"Book {book_id} not found"
+        for book_id, count in copies_needed.items():
+            if available[book_id] < count:
+                return False, f"Not enough available copies of book {book_id}"
+        
+        found_users = set()
+        open_loans = set()
+        for chunk in db.chunks(user_ids):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            found_users.update(user_id for (user_id,) in db.fetch_all(
+                f"SELECT id FROM users WHERE id IN ({placeholders})", tuple(chunk)
+            ) or [])
+            open_loans.update(db.fetch_all(
+                f"SELECT user_id, book_id FROM loans WHERE user_id IN ({placeholders}) "
+                "AND return_date IS NULL",
+                tuple(chunk)
+            ) or [])
+        for user_id in user_ids:
+            if user_id not in found_users:
+                return False, f"User {user_id} not found"
+        for transaction in transactions:
+            if (transaction.user_id, transaction.book_id) in open_loans:
+                return False, (f"User {transaction.user_id} already has book "
+                               f"{transaction.book_id} checked out")
+        
+        # Reserve copies first; each UPDATE must touch every book in its chunk,
+        # so a book whose stock ran out since the check rolls everything back
+        statements = []
+        for chunk in db.chunks(copies_needed):
+            cases = " ".join(["WHEN %s THEN %s"] * len(chunk))
+            case_params = [value for book_id in chunk for value in (book_id, copies_needed[book_id])]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            statements.append((
+                f"UPDATE books SET available_copies = available_copies - CASE id {cases} END "
+                f"WHERE id IN ({placeholders}) AND available_copies >= CASE id {cases} END",
+                tuple(case_params + chunk + case_params),
+                len(chunk)
+            ))
+        
+        # One multi-row INSERT per chunk; InnoDB gives a simple insert
+        # consecutive ids starting at the lastrowid it reports
+        insert_chunks = db.chunks(transactions)
+        for chunk in insert_chunks:
+            values = ", ".join(["(%s, %s, %s, %s)"] * len(chunk))
+            params = [value for transaction in chunk for value in (
+                transaction.book_id, transaction.user_id,
+                transaction.loan_date, transaction.return_date
+            )]
+            statements.append((
+                f"INSERT INTO loans (book_id, user_id, loan_date, return_date) VALUES {values}",
+                tuple(params),
+                len(chunk)
+            ))
+        
+        results = db.execute_transaction(statements, prepared=False)
+        if results is None:
+            return False, "Failed to create loans"
+        
+        for chunk, (_, first_id) in zip(insert_chunks, results[-len(insert_chunks):]):
+            for offset, transaction in enumerate(chunk):
+                transaction.id = first_id + offset
+        return True, len(transactions)
+    
     @classmethod
     def create_loan(cls, book_id, user_id):
         """
@@ -154,19 +336,19 @@ class Transaction:
         self.return_date = datetime.now().strftime('%Y-%m-%d')
         self.status = "returned"
         
-        success = get_db().execute_query(
-            "UPDATE loans SET return_date = %s WHERE id = %s",
-            (self.return_date, self.id)
-        )
+        # Both must touch one row, so a loan already returned elsewhere does
+        # not give its copy back twice
+        results = get_db().execute_transaction([
+            ("UPDATE loans SET return_date = %s WHERE id = %s AND return_date IS NULL",
+             (self.return_date, self.id), 1),
+            (RETURN_BOOK_QUERY, (self.book_id,), 1)
+        ])
         
-        if success:
-            book = Book.find_by_id(self.book_id)
-            if book:
-                book.return_book()
+        if results:
             return True, "Book returned successfully"
         else:
             self.return_date = None
-            self.status = "active"
+            self.update_status()
             return False, "Failed to return book"
     
     def is_overdue(self):
@@ -309,7 +491,6 @@ class Transaction:
                 loan_date=transaction_data[3],
                 return_date=transaction_data[4]
             )
-            transaction.update_status()
             transactions.append(transaction)
         
         return transactions
@@ -338,7 +519,6 @@ class Transaction:
                 loan_date=transaction_data[3],
                 return_date=transaction_data[4]
             )
-            transaction.update_status()
             transactions.append(transaction)
         
         return transactions
@@ -348,17 +528,13 @@ class Transaction:
         """
         Get all loans with optional status filter.
         """
-        base_query = "SELECT id, book_id, user_id, loan_date, return_date FROM loans"
+        base_query = "SELECT l.id, l.book_id, l.user_id, l.loan_date, l.return_date FROM loans l"
         params = []
         
-        if status_filter == "active":
-            base_query += " WHERE return_date IS NULL AND CURDATE() <= DATE_ADD(loan_date, INTERVAL 14 DAY)"
-        elif status_filter == "returned":
-            base_query += " WHERE return_date IS NOT NULL"
-        elif status_filter == "overdue":
-            base_query += " WHERE return_date IS NULL AND CURDATE() > DATE_ADD(loan_date, INTERVAL 14 DAY)"
+        if status_filter in STATUS_CONDITIONS:
+            base_query += " WHERE " + STATUS_CONDITIONS[status_filter]
         
-        base_query += " ORDER BY loan_date DESC"
+        base_query += " ORDER BY l.loan_date DESC"
         
         transactions_data = get_db().fetch_all(base_query, params)
         
@@ -371,7 +547,122 @@ class Transaction:
                 loan_date=transaction_data[3],
                 return_date=transaction_data[4]
             )
-            transaction.update_status()
+            transactions.append(transaction)
+        
+        return transactions
+    
+    @classmethod
+    def get_all_loans_joined(cls, status_filter=None, limit=None, offset=0,
+                             order_by="loan_date", ascending=False):
+        """
+        Get all loans with their book and borrower loaded by one JOIN query,
+        so get_book()/get_user() do not issue a query per loan.
+        Loans are sorted in SQL by "loan_date", "due_date" or "status"
+        (newest first by default); pass limit/offset to fetch a single page.
+        """
+        base_query = """
+            SELECT l.id, l.book_id, l.user_id, l.loan_date, l.return_date,
+                   b.title, b.author, b.isbn, b.genre, b.publication_year,
+                   b.total_copies, b.available_copies, b.image_path,
+                   u.username, u.full_name, u.email, u.user_type
+            FROM loans l
+            LEFT JOIN books b ON b.id = l.book_id
+            LEFT JOIN users u ON u.id = l.user_id
+        """
+        
+        if status_filter in STATUS_CONDITIONS:
+            base_query += " WHERE " + STATUS_CONDITIONS[status_filter]
+        
+        direction = "ASC" if ascending else "DESC"
+        order_column = LOAN_ORDER_COLUMNS.get(order_by, "l.loan_date")
+        base_query += f" ORDER BY {order_column} {direction}, l.id {direction}"
+        params = []
+        
+        if limit is not None:
+            base_query += " LIMIT %s OFFSET %s"
+            params.extend([limit, offset])
+        
+        transactions_data = get_db().fetch_all(base_query, params)
+        
+        books = {}
+        users = {}
+        transactions = []
+        for row in transactions_data or []:
+            transaction = cls(
+                transaction_id=row[0],
+                book_id=row[1],
+                user_id=row[2],
+                loan_date=row[3],
+                return_date=row[4]
+            )
+            
+            if row[5] is not None:
+                if row[1] not in books:
+                    books[row[1]] = Book(
+                        book_id=row[1],
+                        title=row[5],
+                        author=row[6],
+                        isbn=row[7],
+                        genre=row[8],
+                        publication_year=row[9],
+                        total_copies=row[10],
+                        available_copies=row[11],
+                        image_path=row[12]
+                    )
+                transaction._book = books[row[1]]
+            
+            if row[13] is not None:
+                if row[2] not in users:
+                    users[row[2]] = User(
+                        user_id=row[2],
+                        username=row[13],
+                        full_name=row[14],
+                        email=row[15],
+                        user_type=row[16]
+                    )
+                transaction._user = users[row[2]]
+            
+            transactions.append(transaction)
+        
+        return transactions
+    
+    @classmethod
+    def search(cls, query):
+        """
+        Search loans by book title, borrower, status or dates in the database.
+        Every whitespace-separated word of the query must match.
+        """
+        match = f"""
+            (b.title LIKE %s
+             OR u.username LIKE %s
+             OR CAST(l.loan_date AS CHAR) LIKE %s
+             OR CAST(DATE_ADD(l.loan_date, INTERVAL 14 DAY) AS CHAR) LIKE %s
+             OR {STATUS_EXPRESSION} LIKE %s)
+        """
+        tokens = (query or "").split()
+        params = [f"%{token}%" for token in tokens for _ in range(5)]
+        
+        sql = """
+            SELECT l.id, l.book_id, l.user_id, l.loan_date, l.return_date
+            FROM loans l
+            LEFT JOIN books b ON b.id = l.book_id
+            LEFT JOIN users u ON u.id = l.user_id
+        """
+        if tokens:
+            sql += " WHERE " + " AND ".join([match] * len(tokens))
+        sql += " ORDER BY l.loan_date DESC"
+        
+        transactions_data = get_db().fetch_all(sql, params)
+        
+        transactions = []
+        for transaction_data in transactions_data or []:
+            transaction = cls(
+                transaction_id=transaction_data[0],
+                book_id=transaction_data[1],
+                user_id=transaction_data[2],
+                loan_date=transaction_data[3],
+                return_date=transaction_data[4]
+            )
             transactions.append(transaction)
         
         return transactions
@@ -383,6 +674,13 @@ class Transaction:
         """
         return cls.get_all_loans(status_filter="overdue")
     
+    @classmethod
+    def get_active_loans(cls):
+        """
+        Get all loans that have not been returned yet, overdue or not.
+        """
+        return cls.get_all_loans(status_filter="unreturned")
+    
     @classmethod
     def get_loans_due_soon(cls, days=3):
         """
@@ -408,7 +706,6 @@ class Transaction:
                 loan_date=transaction_data[3],
                 return_date=transaction_data[4]
             )
-            transaction.update_status()
             transactions.append(transaction)
         
         return transactions
@@ -480,14 +777,45 @@ class Transaction:
         if not self.id:
             return False, "Cannot delete transaction without ID"
         
-        if not self.return_date:
-            book = Book.find_by_id(self.book_id)
-            if book:
-                book.return_book()
-        
-        success = get_db().execute_query("DELETE FROM loans WHERE id = %s", (self.id,))
+        # The copy goes back first, and only if the row is still an open loan,
+        # whatever this object's return_date says
+        success = get_db().execute_transaction([
+            (RETURN_OPEN_LOAN_COPY_QUERY, (self.id,)),
+            ("DELETE FROM loans WHERE id = %s", (self.id,), 1)
+        ]) is not None
         return success, "Transaction deleted successfully" if success else "Failed to delete transaction"
     
+    @classmethod
+    def delete_many(cls, transaction_ids):
+        """
+        Delete several loans in one transaction, restoring the copies of any
+        that were still out.
+        """
+        db = get_db()
+        chunks = db.chunks(transaction_ids)
+        if not chunks:
+            return True, 0
+        
+        # Each chunk gives back the copies of its still-open loans, counted by
+        # the UPDATE itself inside the transaction, before deleting the loans
+        statements = []
+        for chunk in chunks:
+            placeholders = ", ".join(["%s"] * len(chunk))
+            statements.append((
+                "UPDATE books b JOIN ("
+                f"SELECT book_id, COUNT(*) AS copies FROM loans WHERE id IN ({placeholders}) "
+                "AND return_date IS NULL GROUP BY book_id"
+                ") o ON o.book_id = b.id "
+                "SET b.available_copies = LEAST(b.total_copies, b.available_copies + o.copies)",
+                tuple(chunk)
+            ))
+            statements.append((f"DELETE FROM loans WHERE id IN ({placeholders})", tuple(chunk)))
+        
+        results = db.execute_transaction(statements, prepared=False)
+        if results is None:
+            return False, "Failed to delete transactions"
+        return True, sum(rowcount for rowcount, _ in results[1::2])
+    
     def extend_loan(self, additional_days=7):
         """
         Extend the loan period.
@@ -505,6 +833,7 @@ class Transaction:
         
         new_due_date = current_due_date + timedelta(days=additional_days)
         self.due_date = new_due_date.strftime('%Y-%m-%d')
+        self.update_status()
         
         return True, f"Loan extended by {additional_days} days. New due date: {self.due_date}"
     
@@ -3,12 +3,25 @@ from datetime import datetime
 import re
 import hashlib
 
+# Accepted email format; also used by the registration form's input validator
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+
+# Compiled once; validate_email runs on every user save
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+
+# Length of the users.email column; longer input is rejected before matching
+_EMAIL_MAX_LENGTH = 255
+
 class User:
     """
     User model for handling user-related database operations.
     Represents both readers and librarians in the system.
     """
     
+    # Bumped whenever an existing user's type changes, the field UserIndex
+    # groups by, so an index built before the change is no longer trusted
+    revision = 0
+    
     def __init__(self, user_id=None, username=None, full_name=None, email=None, 
                  password=None, user_type="reader", created_at=None):
         """
@@ -30,6 +43,63 @@ class User:
         self.password = password
         self.user_type = user_type
         self.created_at = created_at or datetime.now().isoformat()
+        self._search_key = None
+        self._search_blob = ""
+    
+    @property
+    def full_name(self):
+        """Full name of the user."""
+        return self._full_name
+    
+    @full_name.setter
+    def full_name(self, value):
+        # Lowercased copies kept alongside so sorts can use attrgetter
+        self._full_name = value
+        self.name_lc = (value or "").lower()
+    
+    @property
+    def username(self):
+        """Username for login."""
+        return self._username
+    
+    @username.setter
+    def username(self, value):
+        self._username = value
+        self.username_lc = (value or "").lower()
+    
+    @property
+    def email(self):
+        """Email address."""
+        return self._email
+    
+    @email.setter
+    def email(self, value):
+        self._email = value
+        self.email_lc = (value or "").lower()
+    
+    @property
+    def user_type(self):
+        """Type of user ('reader' or 'librarian')."""
+        return self._user_type
+    
+    @user_type.setter
+    def user_type(self, value):
+        if "_user_type" in self.__dict__ and self._user_type != value:
+            User.revision += 1
+        self._user_type = value
+        self.user_type_lc = (value or "").lower()
+    
+    @property
+    def search_blob(self):
+        """
+        Lowercased name, email, username and type joined by NUL separators.
+        Rebuilt only when one of those fields has changed.
+        """
+        key = (self.full_name, self.email, self.username, self.user_type)
+        if key != self._search_key:
+            self._search_key = key
+            self._search_blob = "\0".join(field or "" for field in key).lower()
+        return self._search_blob
     
     @staticmethod
     def hash_password(password):
@@ -55,8 +125,8 @@ class User:
         Returns:
             bool: True if valid, False otherwise
         """
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        # fullmatch, unlike match with "$", also rejects a trailing newline
+        return len(email) <= _EMAIL_MAX_LENGTH and _EMAIL_RE.fullmatch(email) is not None
     
     def validate(self):
         """
@@ -125,17 +195,62 @@ class User:
                 INSERT INTO users (username, full_name, email, password, user_type)
                 VALUES (%s, %s, %s, %s, %s)
             """
-            success = get_db().execute_query(
+            new_id = get_db().execute_insert(
                 query, 
                 (self.username, self.full_name, self.email, hashed_password, self.user_type)
             )
             
-            if success:
-                self.id = get_db().fetch_one("SELECT LAST_INSERT_ID()")[0]
+            if new_id is not None:
+                self.id = new_id
                 return True, self.id
             else:
                 return False, "Failed to create user"
     
+    @classmethod
+    def save_many(cls, users):
+        """
+        Insert several new users in a single transaction and set their ids.
+        
+        Args:
+            users (list): Unsaved User objects
+            
+        Returns:
+            tuple: (success, inserted_count_or_error_message)
+        """
+        rows = []
+        for user in users:
+            is_valid, errors = user.validate()
+            if not is_valid:
+                return False, f"{user.username or 'Unnamed user'}: {'; '.join(errors)}"
+            rows.append((user.username, user.full_name, user.email,
+                         cls.hash_password(user.password), user.user_type))
+        
+        if not rows:
+            return True, 0
+        
+        # One multi-row INSERT per chunk; InnoDB gives a simple insert
+        # consecutive ids starting at the lastrowid it reports
+        db = get_db()
+        user_chunks = db.chunks(users)
+        statements = []
+        for chunk, row_chunk in zip(user_chunks, db.chunks(rows)):
+            values = ", ".join(["(%s, %s, %s, %s, %s)"] * len(chunk))
+            statements.append((
+                "INSERT INTO users (username, full_name, email, password, user_type) "
+                f"VALUES {values}",
+                tuple(value for row in row_chunk for value in row),
+                len(chunk)
+            ))
+        results = db.execute_transaction(statements, prepared=False)
+        
+        if results is None:
+            return False, "Failed to create users (duplicate username or email?)"
+        
+        for chunk, (_, first_id) in zip(user_chunks, results):
+            for offset, user in enumerate(chunk):
+                user.id = first_id + offset
+        return True, len(users)
+    
     @classmethod
     def authenticate(cls, username, password):
         """
@@ -250,6 +365,125 @@ class User:
         
         return users
     
+    @classmethod
+    def page(cls, limit=50, offset=0, order_by="full_name", descending=False,
+             user_type=None, after_id=None):
+        """
+        Get one page of users, sorted and filtered in SQL.
+        
+        Args:
+            limit (int): Maximum number of users to return
+            offset (int): Number of users to skip
+            order_by (str): Column to order by
+            descending (bool): Sort in descending order
+            user_type (str, optional): Filter by user type
+            after_id (int): Keyset cursor; when given, returns the users with
+                the next higher IDs in ID order and ignores offset/order_by
+            
+        Returns:
+            list: List of User objects
+        """
+        valid_order_columns = ["full_name", "username", "email", "user_type", "id"]
+        if order_by not in valid_order_columns:
+            order_by = "full_name"
+        
+        conditions = []
+        params = []
+        
+        if user_type:
+            conditions.append("user_type = %s")
+            params.append(user_type)
+        
+        if after_id is not None:
+            conditions.append("id > %s")
+            params.append(after_id)
+            order_clause = "id"
+        else:
+            direction = "DESC" if descending else "ASC"
+            order_clause = f"{order_by} {direction}, id {direction}"
+        
+        query = "SELECT id, username, full_name, email, user_type FROM users"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {order_clause} LIMIT %s"
+        params.append(limit)
+        if after_id is None:
+            query += " OFFSET %s"
+            params.append(offset)
+        
+        users_data = get_db().fetch_all(query, params)
+        
+        users = []
+        for user_data in users_data or []:
+            users.append(cls(
+                user_id=user_data[0],
+                username=user_data[1],
+                full_name=user_data[2],
+                email=user_data[3],
+                user_type=user_data[4]
+            ))
+        
+        return users
+    
+    @classmethod
+    def iter_all(cls, batch_size=256, user_type=None):
+        """
+        Yield every user in ID order, fetching batch_size rows at a time.
+        
+        Args:
+            batch_size (int): Number of rows per query
+            user_type (str, optional): Filter by user type
+            
+        Yields:
+            User: User objects
+        """
+        last_id = 0
+        while True:
+            batch = cls.page(limit=batch_size, user_type=user_type, after_id=last_id)
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            last_id = batch[-1].id
+    
+    @classmethod
+    def search(cls, query):
+        """
+        Search users by name, email, username or user type in the database.
+        
+        Args:
+            query (str): Text to match anywhere in those columns; every
+                whitespace-separated word must match
+            
+        Returns:
+            list: List of User objects
+        """
+        conditions = []
+        params = []
+        for token in (query or "").split():
+            conditions.append(
+                "(full_name LIKE %s OR email LIKE %s OR username LIKE %s OR user_type LIKE %s)"
+            )
+            params.extend([f"%{token}%"] * 4)
+        
+        sql = "SELECT id, username, full_name, email, user_type FROM users"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY full_name"
+        
+        users_data = get_db().fetch_all(sql, params)
+        
+        users = []
+        for user_data in users_data or []:
+            users.append(cls(
+                user_id=user_data[0],
+                username=user_data[1],
+                full_name=user_data[2],
+                email=user_data[3],
+                user_type=user_data[4]
+            ))
+        
+        return users
+    
     def delete(self):
         """
         Delete the user from the database.
@@ -260,17 +494,53 @@ class User:
         if not self.id:
             return False, "Cannot delete user without ID"
         
-        # Check if user has active loans
-        active_loans = get_db().fetch_one(
-            "SELECT COUNT(*) FROM loans WHERE user_id = %s AND return_date IS NULL",
-            (self.id,)
-        )[0]
+        # Refuse the delete in the same statement if the user has active loans
+        deleted = get_db().execute_update(
+            "DELETE FROM users WHERE id = %s AND NOT EXISTS ("
+            "SELECT 1 FROM loans WHERE user_id = %s AND return_date IS NULL)",
+            (self.id, self.id)
+        )
+        
+        if not deleted:
+            active_loans = self.get_active_loans_count() if deleted == 0 else 0
+            if active_loans > 0:
+                return False, f"Cannot delete user with {active_loans} active loans"
+            return False, "Failed to delete user"
+        
+        return True, "User deleted successfully"
+    
+    @classmethod
+    def delete_many(cls, user_ids):
+        """
+        Delete several users in one transaction, skipping any with loan history.
+        
+        Loans reference users without ON DELETE, so the DELETE itself leaves
+        out every user that any loan points at, returned or not; one such user
+        no longer fails the whole batch.
+        
+        Args:
+            user_ids (list): IDs of the users to delete
+            
+        Returns:
+            tuple: (success, deleted_count_or_error_message)
+        """
+        db = get_db()
+        statements = []
+        for chunk in db.chunks(user_ids):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            statements.append((
+                f"DELETE FROM users WHERE id IN ({placeholders}) AND NOT EXISTS ("
+                "SELECT 1 FROM loans WHERE loans.user_id = users.id)",
+                tuple(chunk)
+            ))
         
-        if active_loans > 0:
-            return False, f"Cannot delete user with {active_loans} active loans"
+        if not statements:
+            return True, 0
         
-        success = get_db().execute_query("DELETE FROM users WHERE id = %s", (self.id,))
-        return success, "User deleted successfully" if success else "Failed to delete user"
+        results = db.execute_transaction(statements, prepared=False)
+        if results is None:
+            return False, "Failed to delete users"
+        return True, sum(rowcount for rowcount, _ in results)
     
     def get_active_loans_count(self):
         """
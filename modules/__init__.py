@@ -8,6 +8,7 @@ This package includes the following modules:
 - update_recs: Handles updating existing records
 - delete_recs: Handles deleting records
 - search_recs: Handles searching and filtering records
+- db_worker: Runs record operations on a background database thread
 """
 
 from .add_recs import AddRecordsModule
@@ -15,13 +16,16 @@ from .view_recs import ViewRecordsModule
 from .update_recs import UpdateRecordsModule
 from .delete_recs import DeleteRecordsModule
 from .search_recs import SearchRecordsModule
+from .db_worker import DbWorker, run_in_background
 
 __all__ = [
     'AddRecordsModule',
     'ViewRecordsModule',
     'UpdateRecordsModule',
     'DeleteRecordsModule',
-    'SearchRecordsModule'
+    'SearchRecordsModule',
+    'DbWorker',
+    'run_in_background'
 ]
 
 __version__ = '1.0.0'
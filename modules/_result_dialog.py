@@ -0,0 +1,37 @@
+"""
+Result Dialog Helper
+Shows the outcome of add, update and delete operations in a message box.
+"""
+
+from PySide6.QtWidgets import QMessageBox
+
+
+# (lowercase message fragment, dialog function, title) for failed deletes,
+# checked in order; anything unmatched is shown as an error
+DELETE_CLASSIFIERS = (
+    ("cannot be deleted", QMessageBox.warning, "Cannot Delete"),
+    ("has active", QMessageBox.warning, "Cannot Delete"),
+    ("active loan", QMessageBox.warning, "Cannot Delete"),
+)
+
+
+def show_result(parent, success, message, classifiers=()):
+    """
+    Display the result of a record operation.
+
+    Args:
+        parent: Parent widget for the message box
+        success: Whether the operation was successful
+        message: Message to display
+        classifiers: (fragment, dialog function, title) rules for failures
+    """
+    if success:
+        QMessageBox.information(parent, "Success", message)
+        return
+
+    lowered = message.lower()
+    for fragment, show, title in classifiers:
+        if fragment in lowered:
+            show(parent, title, message)
+            return
+    QMessageBox.critical(parent, "Error", message)
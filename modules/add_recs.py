@@ -1,7 +1,8 @@
-from PySide6.QtWidgets import QMessageBox, QDialog
+from PySide6.QtWidgets import QDialog
 from models.book import Book
 from models.user import User
 from models.transaction import Transaction
+from modules._result_dialog import show_result
 
 
 class AddRecordsModule:
@@ -91,6 +92,68 @@ class AddRecordsModule:
         except Exception as e:
             return False, f"Failed to create loan: {str(e)}", None
     
+    @staticmethod
+    def add_books_bulk(books):
+        """
+        Add several book records in one batched insert.
+        
+        Args:
+            books: List of unsaved Book objects
+            
+        Returns:
+            tuple: (success: bool, message: str, count: int)
+        """
+        try:
+            success, result = Book.save_many(books)
+            if success:
+                return True, f"{result} book(s) added successfully!", result
+            return False, result, 0
+        except Exception as e:
+            return False, f"Failed to add books: {str(e)}", 0
+    
+    @staticmethod
+    def add_users_bulk(users):
+        """
+        Add several user records in one batched insert.
+        
+        Args:
+            users: List of unsaved User objects
+            
+        Returns:
+            tuple: (success: bool, message: str, count: int)
+        """
+        try:
+            success, result = User.save_many(users)
+            if success:
+                return True, f"{result} user(s) added successfully!", result
+            return False, result, 0
+        except Exception as e:
+            return False, f"Failed to add users: {str(e)}", 0
+    
+    @staticmethod
+    def add_loans_bulk(loan_rows):
+        """
+        Add several loan records in one batched insert.
+        
+        Args:
+            loan_rows: Iterable of (book_id, user_id, loan_date) tuples; the
+                due date is derived from the loan date, as for a single loan
+            
+        Returns:
+            tuple: (success: bool, message: str, count: int)
+        """
+        try:
+            transactions = [
+                Transaction(book_id=book_id, user_id=user_id, loan_date=loan_date)
+                for book_id, user_id, loan_date in loan_rows
+            ]
+            success, result = Transaction.save_many(transactions)
+            if success:
+                return True, f"{result} loan(s) created successfully!", result
+            return False, result, 0
+        except Exception as e:
+            return False, f"Failed to create loans: {str(e)}", 0
+    
     @staticmethod
     def show_add_result(parent, success, message):
         """
@@ -101,7 +164,4 @@ class AddRecordsModule:
             success: Whether the operation was successful
             message: Message to display
         """
-        if success:
-            QMessageBox.information(parent, "Success", message)
-        else:
-            QMessageBox.critical(parent, "Error", message)
\ No newline at end of file
+        show_result(parent, success, message)
@@ -0,0 +1,103 @@
+"""
+Database Worker Module
+Runs record operations off the GUI thread and reports back through signals.
+"""
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class DbWorkerSignals(QObject):
+    """Signals emitted by a DbWorker; delivered on the GUI thread."""
+
+    finished = Signal(bool, str, object)
+
+
+class DbWorker(QRunnable):
+    """
+    Runnable that calls a record operation on a pool thread.
+
+    The call's result is normalised to (success, message, obj) so callers can
+    handle every operation the same way:
+    - a (success, message, obj) tuple is passed through
+    - a (success, message_or_data) tuple becomes (success, message, data)
+    - any other value becomes (True, "", value)
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        """
+        Initialize the worker.
+
+        Args:
+            fn: Callable to run off the GUI thread
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = DbWorkerSignals()
+
+    def run(self):
+        """Run the operation and emit its normalised result."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.finished.emit(False, str(e), None)
+            return
+
+        if isinstance(result, tuple) and len(result) == 3:
+            success, message, obj = result
+        elif isinstance(result, tuple) and len(result) == 2:
+            success, obj = result
+            message = obj if isinstance(obj, str) else ""
+        else:
+            success, message, obj = True, "", result
+        self.signals.finished.emit(bool(success), message or "", obj)
+
+
+_pool = None
+
+# Queued workers, kept alive until their result has been delivered; without
+# a reference the worker and its signals can be collected mid-flight
+_pending = set()
+
+
+def db_thread_pool():
+    """
+    Get the pool used for database work.
+
+    DatabaseManager shares one connection, so the pool runs a single thread:
+    operations execute in submission order and never contend for the lock.
+
+    Returns:
+        QThreadPool: The shared database pool
+    """
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(1)
+    return _pool
+
+
+def run_in_background(fn, *args, on_finished=None, **kwargs):
+    """
+    Queue a record operation on the database thread.
+
+    Args:
+        fn: Callable to run, e.g. ViewRecordsModule.get_all_books or book.save
+        *args: Positional arguments for fn
+        on_finished: Optional slot taking (success, message, obj)
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        DbWorker: The queued worker
+    """
+    worker = DbWorker(fn, *args, **kwargs)
+    if on_finished is not None:
+        worker.signals.finished.connect(on_finished)
+    # Connected last so it runs after on_finished on the GUI thread
+    worker.signals.finished.connect(lambda *_: _pending.discard(worker))
+    _pending.add(worker)
+    db_thread_pool().start(worker)
+    return worker
@@ -4,6 +4,10 @@ Handles deleting records from the database.
 """
 
 from PySide6.QtWidgets import QMessageBox
+from models.book import Book
+from models.user import User
+from models.transaction import Transaction
+from modules._result_dialog import show_result, DELETE_CLASSIFIERS
 
 
 class DeleteRecordsModule:
@@ -105,6 +109,87 @@ class DeleteRecordsModule:
         except Exception as e:
             return False, f"Failed to delete loan: {str(e)}"
     
+    @staticmethod
+    def bulk_delete_books(parent, books):
+        """
+        Delete several book records in one transaction after confirmation.
+        
+        Args:
+            parent: Parent widget for dialogs
+            books: List of book objects to delete
+            
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
+            if not DeleteRecordsModule.bulk_delete_confirm(parent, "book", len(books)):
+                return False, "Operation cancelled"
+            
+            success, result = Book.delete_many([book.id for book in books])
+            if not success:
+                return False, result
+            return True, DeleteRecordsModule._bulk_delete_message("book", result, len(books))
+            
+        except Exception as e:
+            return False, f"Failed to delete books: {str(e)}"
+    
+    @staticmethod
+    def bulk_delete_users(parent, users):
+        """
+        Delete several user records in one transaction after confirmation.
+        
+        Args:
+            parent: Parent widget for dialogs
+            users: List of user objects to delete
+            
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
+            if not DeleteRecordsModule.bulk_delete_confirm(parent, "user", len(users)):
+                return False, "Operation cancelled"
+            
+            success, result = User.delete_many([user.id for user in users])
+            if not success:
+                return False, result
+            return True, DeleteRecordsModule._bulk_delete_message("user", result, len(users))
+            
+        except Exception as e:
+            return False, f"Failed to delete users: {str(e)}"
+    
+    @staticmethod
+    def bulk_delete_loans(parent, loans):
+        """
+        Delete several loan records in one transaction after confirmation.
+        
+        Args:
+            parent: Parent widget for dialogs
+            loans: List of loan transactions to delete
+            
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
+            if not DeleteRecordsModule.bulk_delete_confirm(parent, "loan record", len(loans)):
+                return False, "Operation cancelled"
+            
+            success, result = Transaction.delete_many([loan.id for loan in loans])
+            if not success:
+                return False, result
+            return True, f"{result} loan record(s) deleted successfully"
+            
+        except Exception as e:
+            return False, f"Failed to delete loans: {str(e)}"
+    
+    @staticmethod
+    def _bulk_delete_message(record_type, deleted, requested):
+        """Describe a bulk delete, mentioning records kept for their loan history."""
+        message = f"{deleted} {record_type}(s) deleted successfully"
+        skipped = requested - deleted
+        if skipped:
+            message += f"\n{skipped} {record_type}(s) with loan history were not deleted"
+        return message
+    
     @staticmethod
     def confirm_delete(parent, record_type, record_identifier):
         """
@@ -160,13 +245,7 @@ class DeleteRecordsModule:
             success: Whether the operation was successful
             message: Message to display
         """
-        if success:
-            QMessageBox.information(parent, "Success", message)
-        else:
-            if "cannot be deleted" in message.lower() or "has active" in message.lower():
-                QMessageBox.warning(parent, "Cannot Delete", message)
-            else:
-                QMessageBox.critical(parent, "Error", message)
+        show_result(parent, success, message, DELETE_CLASSIFIERS)
     
     @staticmethod
     def bulk_delete_confirm(parent, record_type, count):
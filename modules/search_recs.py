@@ -1,3 +1,142 @@
+from bisect import bisect_right
+from itertools import compress, islice
+from operator import attrgetter
+from models.book import Book
+from models.user import User
+from models.transaction import Transaction
+
+
+class BookIndex:
+    """
+    Column-oriented snapshot of a book list for repeated filtering and sorting.
+    Rebuilt whenever the book list is reloaded from the database, and again
+    when an indexed field of any book has changed since it was built.
+    """
+    
+    current = None
+    
+    # Joins the per-book blobs; never typed into a search box
+    RECORD_SEPARATOR = "\x01"
+    
+    def __init__(self, books):
+        self.books = books
+        self.revision = Book.revision
+        self.available_mask = [book.available_copies > 0 for book in books]
+        self.unavailable_mask = [not available for available in self.available_mask]
+        self.by_genre = {}
+        for book in books:
+            self.by_genre.setdefault((book.genre or "").lower(), []).append(book)
+        self.sort_keys = {
+            "title": [book.title_lc for book in books],
+            "author": [book.author_lc for book in books],
+            "year": [book.publication_year or 0 for book in books],
+            "available": [book.available_copies for book in books],
+        }
+        self._orders = {}
+        # Every search blob in one string, so a query is a handful of
+        # str.find calls over the corpus instead of one test per book
+        self.blobs = [book.search_blob for book in books]
+        self.corpus = self.RECORD_SEPARATOR.join(self.blobs)
+        self.starts = []
+        position = 0
+        for blob in self.blobs:
+            self.starts.append(position)
+            position += len(blob) + 1
+    
+    @classmethod
+    def build(cls, books):
+        """Index a freshly loaded book list and make it the current index."""
+        cls.current = cls(books)
+        return cls.current
+    
+    @classmethod
+    def for_books(cls, books):
+        """
+        Return the current index if it was built from this exact list,
+        rebuilding it first if a book was changed in place since.
+        """
+        index = cls.current
+        if index is None or index.books is not books:
+            return None
+        if index.revision != Book.revision:
+            index = cls.build(books)
+        return index
+    
+    def sorted_books(self, sort_by, ascending=True):
+        """Return the books ordered by a precomputed key column."""
+        order = self._orders.get((sort_by, ascending))
+        if order is None:
+            keys = self.sort_keys[sort_by]
+            order = sorted(range(len(keys)), key=keys.__getitem__, reverse=not ascending)
+            self._orders[(sort_by, ascending)] = order
+        books = self.books
+        return [books[i] for i in order]
+    
+    def matching_indices(self, needle):
+        """Return the positions of the books whose blob contains needle."""
+        if self.RECORD_SEPARATOR in needle:
+            return [i for i, blob in enumerate(self.blobs) if needle in blob]
+        
+        find = self.corpus.find
+        starts = self.starts
+        count = len(starts)
+        indices = []
+        position = find(needle)
+        while position >= 0:
+            i = bisect_right(starts, position) - 1
+            indices.append(i)
+            if i + 1 >= count:
+                break
+            # Resume at the next book so each match is reported once
+            position = find(needle, starts[i + 1])
+        return indices
+    
+    def search(self, tokens):
+        """Return the books whose blob contains every token."""
+        indices = self.matching_indices(tokens[0])
+        blobs = self.blobs
+        for token in tokens[1:]:
+            indices = [i for i in indices if token in blobs[i]]
+        books = self.books
+        return [books[i] for i in indices]
+
+
+class UserIndex:
+    """
+    Snapshot of a user list grouped by user type for repeated filtering.
+    Rebuilt whenever the user list is reloaded from the database, and again
+    when a user's type has changed since it was built.
+    """
+    
+    current = None
+    
+    def __init__(self, users):
+        self.users = users
+        self.revision = User.revision
+        self.by_type = {}
+        for user in users:
+            self.by_type.setdefault(user.user_type_lc, []).append(user)
+    
+    @classmethod
+    def build(cls, users):
+        """Index a freshly loaded user list and make it the current index."""
+        cls.current = cls(users)
+        return cls.current
+    
+    @classmethod
+    def for_users(cls, users):
+        """
+        Return the current index if it was built from this exact list,
+        rebuilding it first if a user was changed in place since.
+        """
+        index = cls.current
+        if index is None or index.users is not users:
+            return None
+        if index.revision != User.revision:
+            index = cls.build(users)
+        return index
+
+
 class SearchRecordsModule:
     """Module for searching and filtering records in the system."""
     
@@ -7,26 +146,46 @@ class SearchRecordsModule:
         Search and filter books based on search text.
         
         Args:
-            books: List of book objects to search
+            books: List of book objects to search, or None to
+                query the database directly
             search_text: Search query string
             
         Returns:
             list: Filtered list of books matching the search criteria
         """
+        if books is None:
+            return Book.search((search_text or "").strip())
+        
         if not search_text:
             return books
         
-        search_text = search_text.lower().strip()
-        filtered_books = []
+        index = BookIndex.for_books(books)
+        tokens = search_text.lower().split()
+        if index is not None and tokens:
+            return index.search(tokens)
         
-        for book in books:
-            if (search_text in book.title.lower() or
-                search_text in book.author.lower() or
-                (book.genre and search_text in book.genre.lower()) or
-                search_text in str(book.publication_year)):
-                filtered_books.append(book)
+        return SearchRecordsModule._match_all_tokens(books, search_text)
+    
+    @staticmethod
+    def search_books_iter(books, search_text, max_results=None):
+        """
+        Lazily search books, stopping once max_results matches are found.
         
-        return filtered_books
+        Args:
+            books: Iterable of book objects, or None to stream every book
+                from the database with Book.iter_all()
+            search_text: Search query string
+            max_results: Maximum number of matches to yield, or None for all
+            
+        Yields:
+            Book: Books matching every word of the search text
+        """
+        if books is None:
+            books = Book.iter_all()
+        
+        tokens = (search_text or "").lower().split()
+        matches = SearchRecordsModule._iter_token_matches(books, tokens)
+        yield from islice(matches, max_results)
     
     @staticmethod
     def search_users(users, search_text):
@@ -34,26 +193,20 @@ class SearchRecordsModule:
         Search and filter users based on search text.
         
         Args:
-            users: List of user objects to search
+            users: List of user objects to search, or None to
+                query the database directly
             search_text: Search query string
             
         Returns:
             list: Filtered list of users matching the search criteria
         """
+        if users is None:
+            return User.search((search_text or "").strip())
+        
         if not search_text:
             return users
         
-        search_text = search_text.lower().strip()
-        filtered_users = []
-        
-        for user in users:
-            if (search_text in user.full_name.lower() or
-                search_text in user.email.lower() or
-                search_text in user.username.lower() or
-                search_text in user.user_type.lower()):
-                filtered_users.append(user)
-        
-        return filtered_users
+        return SearchRecordsModule._match_all_tokens(users, search_text)
     
     @staticmethod
     def search_loans(loans, search_text):
@@ -61,34 +214,69 @@ class SearchRecordsModule:
         Search and filter loans based on search text.
         
         Args:
-            loans: List of loan transaction objects to search
+            loans: List of loan transaction objects to search, or None to
+                query the database directly
             search_text: Search query string
             
         Returns:
             list: Filtered list of loans matching the search criteria
         """
+        if loans is None:
+            return Transaction.search((search_text or "").strip())
+        
         if not search_text:
             return loans
         
-        search_text = search_text.lower().strip()
-        filtered_loans = []
+        # Loans from get_user_loans/get_book_loans have no book or borrower
+        # loaded; one SQL search beats two lookups per loan to build blobs
+        if not all(loan.details_loaded for loan in loans):
+            matched_ids = {loan.id for loan in Transaction.search(search_text.strip())}
+            return [loan for loan in loans if loan.id in matched_ids]
         
-        for loan in loans:
-            book = loan.get_book()
-            user = loan.get_user()
-            
-            book_title = book.title.lower() if book else ""
-            borrower_name = user.username.lower() if user else ""
-            status = loan.update_status().lower()
+        return SearchRecordsModule._match_all_tokens(loans, search_text)
+    
+    @staticmethod
+    def _match_all_tokens(records, search_text):
+        """
+        Keep the records whose search blob contains every word of the query.
+        
+        Args:
+            records: Model objects exposing a search_blob property
+            search_text: Search query string
             
-            if (search_text in book_title or
-                search_text in borrower_name or
-                search_text in status or
-                search_text in loan.loan_date or
-                search_text in loan.due_date):
-                filtered_loans.append(loan)
+        Returns:
+            list: Records matching all words
+        """
+        tokens = search_text.lower().split()
+        if not tokens:
+            return records
+        if len(tokens) == 1:
+            needle = tokens[0]
+            return [record for record in records if needle in record.search_blob]
+        return list(SearchRecordsModule._iter_token_matches(records, tokens))
+    
+    @staticmethod
+    def _iter_token_matches(records, tokens):
+        """
+        Yield the records whose search blob contains every token.
         
-        return filtered_loans
+        The blob is read once per record and each token is a single
+        substring scan over it, stopping at the first token that is missing.
+        
+        Args:
+            records: Iterable of model objects exposing a search_blob property
+            tokens: Lowercased query words
+            
+        Yields:
+            Records matching all tokens
+        """
+        for record in records:
+            blob = record.search_blob
+            for token in tokens:
+                if token not in blob:
+                    break
+            else:
+                yield record
     
     @staticmethod
     def filter_books_by_genre(books, genre):
@@ -105,7 +293,12 @@ class SearchRecordsModule:
         if not genre or genre.lower() == "all":
             return books
         
-        return [book for book in books if book.genre and book.genre.lower() == genre.lower()]
+        genre = genre.lower()
+        index = BookIndex.for_books(books)
+        if index is not None:
+            return list(index.by_genre.get(genre, ()))
+        
+        return [book for book in books if book.genre and book.genre.lower() == genre]
     
     @staticmethod
     def filter_books_by_availability(books, available_only=True):
@@ -119,6 +312,11 @@ class SearchRecordsModule:
         Returns:
             list: Filtered list of books
         """
+        index = BookIndex.for_books(books)
+        if index is not None:
+            mask = index.available_mask if available_only else index.unavailable_mask
+            return list(compress(books, mask))
+        
         if available_only:
             return [book for book in books if book.available_copies > 0]
         else:
@@ -139,7 +337,12 @@ class SearchRecordsModule:
         if not user_type or user_type.lower() == "all":
             return users
         
-        return [user for user in users if user.user_type.lower() == user_type.lower()]
+        user_type = user_type.lower()
+        index = UserIndex.for_users(users)
+        if index is not None:
+            return list(index.by_type.get(user_type, ()))
+        
+        return [user for user in users if user.user_type_lc == user_type]
     
     @staticmethod
     def filter_loans_by_status(loans, status):
@@ -160,8 +363,7 @@ class SearchRecordsModule:
         filtered_loans = []
         
         for loan in loans:
-            loan_status = loan.update_status().lower()
-            if status == loan_status:
+            if status == loan.status:
                 filtered_loans.append(loan)
         
         return filtered_loans
@@ -172,11 +374,15 @@ class SearchRecordsModule:
         Filter to get only overdue loans.
         
         Args:
-            loans: List of loan transaction objects to filter
+            loans: List of loan transaction objects to filter, or None to
+                query the database directly
             
         Returns:
             list: List of overdue loans
         """
+        if loans is None:
+            return Transaction.get_overdue_loans()
+        
         return [loan for loan in loans if loan.is_overdue()]
     
     @staticmethod
@@ -185,11 +391,15 @@ class SearchRecordsModule:
         Filter to get only active (not returned) loans.
         
         Args:
-            loans: List of loan transaction objects to filter
+            loans: List of loan transaction objects to filter, or None to
+                query the database directly
             
         Returns:
             list: List of active loans
         """
+        if loans is None:
+            return Transaction.get_active_loans()
+        
         return [loan for loan in loans if not loan.return_date]
     
     @staticmethod
@@ -205,14 +415,18 @@ class SearchRecordsModule:
         Returns:
             list: Sorted list of books
         """
+        index = BookIndex.for_books(books)
+        if index is not None and sort_by in index.sort_keys:
+            return index.sorted_books(sort_by, ascending)
+        
         if sort_by == "title":
-            return sorted(books, key=lambda b: b.title.lower(), reverse=not ascending)
+            return sorted(books, key=attrgetter('title_lc'), reverse=not ascending)
         elif sort_by == "author":
-            return sorted(books, key=lambda b: b.author.lower(), reverse=not ascending)
+            return sorted(books, key=attrgetter('author_lc'), reverse=not ascending)
         elif sort_by == "year":
-            return sorted(books, key=lambda b: b.publication_year, reverse=not ascending)
+            return sorted(books, key=attrgetter('publication_year'), reverse=not ascending)
         elif sort_by == "available":
-            return sorted(books, key=lambda b: b.available_copies, reverse=not ascending)
+            return sorted(books, key=attrgetter('available_copies'), reverse=not ascending)
         return books
     
     @staticmethod
@@ -229,13 +443,13 @@ class SearchRecordsModule:
             list: Sorted list of users
         """
         if sort_by == "name":
-            return sorted(users, key=lambda u: u.full_name.lower(), reverse=not ascending)
+            return sorted(users, key=attrgetter('name_lc'), reverse=not ascending)
         elif sort_by == "username":
-            return sorted(users, key=lambda u: u.username.lower(), reverse=not ascending)
+            return sorted(users, key=attrgetter('username_lc'), reverse=not ascending)
         elif sort_by == "email":
-            return sorted(users, key=lambda u: u.email.lower(), reverse=not ascending)
+            return sorted(users, key=attrgetter('email_lc'), reverse=not ascending)
         elif sort_by == "type":
-            return sorted(users, key=lambda u: u.user_type.lower(), reverse=not ascending)
+            return sorted(users, key=attrgetter('user_type_lc'), reverse=not ascending)
         return users
     
     @staticmethod
@@ -244,17 +458,21 @@ class SearchRecordsModule:
         Sort loans by a specific attribute.
         
         Args:
-            loans: List of loan transaction objects to sort
+            loans: List of loan transaction objects to sort, or None to
+                load all loans already sorted by the database
             sort_by: Attribute to sort by
             ascending: Sort order
             
         Returns:
             list: Sorted list of loans
         """
+        if loans is None:
+            return Transaction.get_all_loans_joined(order_by=sort_by, ascending=ascending)
+        
         if sort_by == "loan_date":
-            return sorted(loans, key=lambda l: l.loan_date, reverse=not ascending)
+            return sorted(loans, key=attrgetter('loan_date'), reverse=not ascending)
         elif sort_by == "due_date":
-            return sorted(loans, key=lambda l: l.due_date, reverse=not ascending)
+            return sorted(loans, key=attrgetter('due_date'), reverse=not ascending)
         elif sort_by == "status":
-            return sorted(loans, key=lambda l: l.update_status(), reverse=not ascending)
+            return sorted(loans, key=attrgetter('status'), reverse=not ascending)
         return loans
\ No newline at end of file
@@ -1,4 +1,6 @@
 from PySide6.QtWidgets import QMessageBox, QDialog
+from models.book import Book
+from modules._result_dialog import show_result
 
 
 class UpdateRecordsModule:
@@ -105,22 +107,47 @@ class UpdateRecordsModule:
             book: The book object to update
             change: The change in availability
             
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        success, message = UpdateRecordsModule.bulk_update_book_availability({book: change})
+        if success:
+            return True, "Book availability updated successfully"
+        return False, message
+    
+    @staticmethod
+    def bulk_update_book_availability(changes):
+        """
+        Update the availability count of several books in one statement.
+        
+        Args:
+            changes: Dict mapping book objects to their change in availability
+            
         Returns:
             tuple: (success: bool, message: str)
         """
         try:
-            new_available = book.available_copies + change
-            if new_available < 0:
-                return False, "Cannot reduce availability below 0"
-            if new_available > book.total_copies:
-                return False, "Available copies cannot exceed total copies"
+            # Sum per ID so two objects for the same book add up instead of
+            # one overwriting the other's change
+            id_changes = {}
+            for book, change in changes.items():
+                id_changes[book.id] = id_changes.get(book.id, 0) + change
             
-            book.available_copies = new_available
-            success, result = book.save()
-            if success:
-                return True, "Book availability updated successfully"
-            else:
-                return False, result
+            # Early, friendly messages from the loaded counts; the UPDATE
+            # re-checks the bounds against the current rows
+            for book in changes:
+                new_available = book.available_copies + id_changes[book.id]
+                if new_available < 0:
+                    return False, f"Cannot reduce availability of '{book.title}' below 0"
+                if new_available > book.total_copies:
+                    return False, f"Available copies of '{book.title}' cannot exceed total copies"
+            
+            if not Book.bulk_adjust_availability(id_changes):
+                return False, "Failed to update book availability; the counts may have changed, reload and try again"
+            
+            for book in changes:
+                book.available_copies += id_changes[book.id]
+            return True, f"Availability updated for {len(id_changes)} book(s)"
         except Exception as e:
             return False, f"Failed to update book availability: {str(e)}"
     
@@ -134,10 +161,7 @@ class UpdateRecordsModule:
             success: Whether the operation was successful
             message: Message to display
         """
-        if success:
-            QMessageBox.information(parent, "Success", message)
-        else:
-            QMessageBox.critical(parent, "Error", message)
+        show_result(parent, success, message)
     
     @staticmethod
     def confirm_return(parent, book_title):
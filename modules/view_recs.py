@@ -1,6 +1,7 @@
 from models.book import Book
 from models.user import User
 from models.transaction import Transaction
+from modules.search_recs import BookIndex, UserIndex
 
 
 class ViewRecordsModule:
@@ -15,8 +16,9 @@ class ViewRecordsModule:
             tuple: (success: bool, data: list or error_message: str)
         """
         try:
-            books = Book.get_all()
-            return True, books if books else []
+            books = Book.get_all() or []
+            BookIndex.build(books)
+            return True, books
         except Exception as e:
             return False, f"Failed to load books: {str(e)}"
     
@@ -32,8 +34,9 @@ class ViewRecordsModule:
             tuple: (success: bool, data: list or error_message: str)
         """
         try:
-            users = User.get_all(user_type=user_type)
-            return True, users if users else []
+            users = User.get_all(user_type=user_type) or []
+            UserIndex.build(users)
+            return True, users
         except Exception as e:
             return False, f"Failed to load users: {str(e)}"
     
@@ -46,7 +49,80 @@ class ViewRecordsModule:
             tuple: (success: bool, data: list or error_message: str)
         """
         try:
-            loans = Transaction.get_all_loans()
+            loans = Transaction.get_all_loans_joined()
+            return True, loans if loans else []
+        except Exception as e:
+            return False, f"Failed to load loans: {str(e)}"
+    
+    @staticmethod
+    def get_books_page(offset=0, limit=50, sort_by="title", ascending=True,
+                       genre=None, available_only=False):
+        """
+        Retrieve one page of books, sorted and filtered by the database.
+        
+        Args:
+            offset: Number of books to skip
+            limit: Maximum number of books to return
+            sort_by: "title", "author", "year" or "available"
+            ascending: Sort order
+            genre: Optional genre filter
+            available_only: Only return available books
+            
+        Returns:
+            tuple: (success: bool, data: list or error_message: str)
+        """
+        columns = {"title": "title", "author": "author", "year": "publication_year",
+                   "available": "available_copies"}
+        try:
+            books = Book.page(limit=limit, offset=offset,
+                              order_by=columns.get(sort_by, "title"),
+                              descending=not ascending, genre=genre,
+                              available_only=available_only)
+            return True, books if books else []
+        except Exception as e:
+            return False, f"Failed to load books: {str(e)}"
+    
+    @staticmethod
+    def get_users_page(offset=0, limit=50, sort_by="name", ascending=True, user_type=None):
+        """
+        Retrieve one page of users, sorted and filtered by the database.
+        
+        Args:
+            offset: Number of users to skip
+            limit: Maximum number of users to return
+            sort_by: "name", "username", "email" or "type"
+            ascending: Sort order
+            user_type: Optional filter for user type
+            
+        Returns:
+            tuple: (success: bool, data: list or error_message: str)
+        """
+        columns = {"name": "full_name", "username": "username", "email": "email",
+                   "type": "user_type"}
+        try:
+            users = User.page(limit=limit, offset=offset,
+                              order_by=columns.get(sort_by, "full_name"),
+                              descending=not ascending, user_type=user_type)
+            return True, users if users else []
+        except Exception as e:
+            return False, f"Failed to load users: {str(e)}"
+    
+    @staticmethod
+    def get_loans_page(offset=0, limit=50, status_filter=None):
+        """
+        Retrieve one page of loans, newest first.
+        
+        Args:
+            offset: Number of loans to skip
+            limit: Maximum number of loans to return
+            status_filter: Optional "active", "returned" or "overdue"
+            
+        Returns:
+            tuple: (success: bool, data: list or error_message: str)
+        """
+        try:
+            loans = Transaction.get_all_loans_joined(status_filter=status_filter,
+                                                     limit=limit, offset=offset)
             return True, loans if loans else []
         except Exception as e:
             return False, f"Failed to load loans: {str(e)}"
@@ -151,9 +227,8 @@ class ViewRecordsModule:
             tuple: (success: bool, data: list or error_message: str)
         """
         try:
-            all_loans = Transaction.get_all_loans()
-            active_loans = [loan for loan in all_loans if not loan.return_date]
-            return True, active_loans
+            loans = Transaction.get_active_loans()
+            return True, loans if loans else []
         except Exception as e:
             return False, f"Failed to retrieve active loans: {str(e)}"
     
@@ -1,11 +1,241 @@
-from PySide6.QtCore import Qt, QSize
+import hashlib
+import hmac
+import os
+import re
+from PySide6.QtCore import Qt, QSize, QTimer, Slot
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QLineEdit,
     QPushButton, QFrame, QMessageBox
 )
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QPixmap, QImageReader, QShortcut, QKeySequence
 from utils import resource_path 
+from widgets.gradient_frame import GradientFrame
 from models.user import User
+from modules.db_worker import run_in_background
+
+
+# Digest of the demo "username:password" pair, compared in constant time
+_DEMO_HASH = hashlib.sha256(b"demo:demo").digest()
+
+
+def _is_demo(username, password):
+    """
+    Check credentials against the demo account without a plain string comparison.
+
+    Args:
+        username: Entered username
+        password: Entered password
+
+    Returns:
+        bool: True if the credentials are demo/demo
+    """
+    candidate = hashlib.sha256(f"{username}:{password}".encode()).digest()
+    return hmac.compare_digest(candidate, _DEMO_HASH)
+
+
+# Stylesheet blocks, keyed to widgets by object name and applied once per screen
+_CARD_QSS = """
+    QFrame#loginCard {
+        background: white;
+        border-radius: 12px;
+        border: none;
+    }
+"""
+
+_ICON_FALLBACK_QSS = """
+    QLabel#loginIconFallback {
+        font-size: 48px;
+    }
+"""
+
+_TITLE_QSS = """
+    QLabel#loginTitle {
+        font-size: 28px;
+        font-weight: bold;
+        color: #333;
+        margin: 0;
+        padding: 0;
+    }
+"""
+
+_SUBTITLE_QSS = """
+    QLabel#loginSubtitle {
+        font-size: 16px;
+        color: #666;
+        margin: 0;
+        padding: 0;
+    }
+"""
+
+_FIELD_LABEL_QSS = """
+    QLabel#fieldLabel {
+        font-size: 14px;
+        font-weight: 600;
+        color: #333;
+    }
+"""
+
+_INPUT_QSS = """
+    QLineEdit#authInput {
+        padding: 12px;
+        border: 1px solid #ddd;
+        border-radius: 6px;
+        font-size: 14px;
+        background: white;
+    }
+    QLineEdit#authInput:focus {
+        border: 2px solid #667eea;
+    }
+    QLineEdit#authInput:hover {
+        border: 1px solid #bbb;
+    }
+"""
+
+_ERROR_QSS = """
+    QLabel#errorLabel {
+        color: #e74c3c;
+        font-size: 14px;
+        padding: 5px;
+        background-color: #fadbd8;
+        border-radius: 4px;
+        border: 1px solid #e74c3c;
+    }
+"""
+
+_PRIMARY_BUTTON_QSS = """
+    QPushButton#primaryButton {
+        background-color: #667eea;
+        color: white;
+        border: none;
+        padding: 12px;
+        border-radius: 6px;
+        font-size: 16px;
+        font-weight: 600;
+    }
+    QPushButton#primaryButton:hover {
+        background-color: #5a6fd5;
+    }
+    QPushButton#primaryButton:pressed {
+        background-color: #4a5fc0;
+    }
+    QPushButton#primaryButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+"""
+
+_SECONDARY_BUTTON_QSS = """
+    QPushButton#secondaryButton {
+        background-color: transparent;
+        color: #667eea;
+        border: 1px solid #667eea;
+        padding: 10px;
+        border-radius: 6px;
+        font-size: 14px;
+    }
+    QPushButton#secondaryButton:hover {
+        background-color: #f0f3ff;
+    }
+    QPushButton#secondaryButton:pressed {
+        background-color: #e0e7ff;
+    }
+"""
+
+_LOGIN_QSS = "".join((
+    _CARD_QSS, _ICON_FALLBACK_QSS, _TITLE_QSS, _SUBTITLE_QSS,
+    _FIELD_LABEL_QSS, _INPUT_QSS, _ERROR_QSS, _PRIMARY_BUTTON_QSS, _SECONDARY_BUTTON_QSS
+))
+
+# Logo location, checked once so a missing file goes straight to the emoji fallback
+_ICON_PATH = resource_path("assets/lms.png")
+_ICON_EXISTS = os.path.isfile(_ICON_PATH)
+
+# Scaled logo pixmaps shared by every LoginScreen, keyed by (device pixel ratio, size)
+_PIXMAP_CACHE = {}
+
+
+def _logo_pixmap(dpr, size=80):
+    """
+    Get the logo scaled for the given device pixel ratio, loading it once.
+
+    Args:
+        dpr: Device pixel ratio of the screen showing the logo
+        size: Logical width and height of the logo
+
+    Returns:
+        QPixmap: The scaled logo, or a null pixmap if it could not be loaded
+    """
+    key = (dpr, size)
+    pixmap = _PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        # Decode straight to the target size instead of loading the full
+        # image and rescaling it
+        reader = QImageReader(_ICON_PATH)
+        source_size = reader.size()
+        if source_size.isValid():
+            reader.setScaledSize(source_size.scaled(
+                QSize(size, size) * dpr, Qt.KeepAspectRatio
+            ))
+        pixmap = QPixmap.fromImage(reader.read())
+        if not pixmap.isNull():
+            pixmap.setDevicePixelRatio(dpr)
+        _PIXMAP_CACHE[key] = pixmap
+    return pixmap
+
+
+# The login field takes a username or an email, and registration puts no
+# charset limit on usernames, so only reject what no account can match:
+# control characters, or more than the email column's 255 characters
+_USER_RE = re.compile(r"[^\x00-\x1f\x7f]{1,255}\Z")
+
+# Card title per login type
+_TITLES = {
+    "reader": "Reader Login",
+    "librarian": "Librarian Login",
+}
+
+
+def _vbox(parent=None, spacing=0, margins=(0, 0, 0, 0), align=None):
+    """
+    Create a configured vertical layout.
+
+    Args:
+        parent: Optional widget to install the layout on
+        spacing: Spacing between items
+        margins: (left, top, right, bottom) contents margins
+        align: Optional alignment for the layout
+
+    Returns:
+        QVBoxLayout: The new layout
+    """
+    layout = QVBoxLayout(parent) if parent is not None else QVBoxLayout()
+    layout.setSpacing(spacing)
+    layout.setContentsMargins(*margins)
+    if align is not None:
+        layout.setAlignment(align)
+    return layout
+
+
+def _label(text, object_name, align=None, word_wrap=False):
+    """
+    Create a label styled through its object name.
+
+    Args:
+        text: Label text
+        object_name: Object name matching a block in the screen stylesheet
+        align: Optional text alignment
+        word_wrap: Whether the text wraps
+
+    Returns:
+        QLabel: The new label
+    """
+    label = QLabel(text)
+    label.setObjectName(object_name)
+    if align is not None:
+        label.setAlignment(align)
+    if word_wrap:
+        label.setWordWrap(True)
+    return label
 
 
 class LoginScreen(QWidget):
@@ -15,264 +245,154 @@ class LoginScreen(QWidget):
         super().__init__()
         self.app = app
         self.user_type = user_type
-        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.error_label = None
+        self._success_box = None
         self.setup_ui()
 
     def setup_ui(self):
-        """Setup the user interface."""
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
+        """Setup the user interface, deferring the decorative parts to the next event-loop tick."""
+        self._build_primary()
+        QTimer.singleShot(0, self._build_secondary)
+
+    def _build_primary(self):
+        """Build the background, card, inputs and login button needed for the first paint."""
+        main_layout = _vbox(self)
         
-        background_frame = QFrame()
-        background_frame.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(
-                    spread: pad, x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #667eea, stop: 1 #764ba2
-                );
-                border: none;
-            }
-        """)
-        background_layout = QVBoxLayout(background_frame)
-        background_layout.setContentsMargins(20, 20, 20, 20)
-        background_layout.setSpacing(0)
+        background_frame = GradientFrame()
+        background_layout = _vbox(background_frame, margins=(20, 20, 20, 20))
         background_layout.addStretch()
         
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background: white;
-                border-radius: 12px;
-                border: none;
-            }
-        """)
+        card.setObjectName("loginCard")
         card.setFixedWidth(450)
-        card_layout = QVBoxLayout(card)
-        card_layout.setContentsMargins(40, 40, 40, 40)
-        card_layout.setSpacing(25)
+        card_layout = _vbox(card, spacing=25, margins=(40, 40, 40, 40))
         
-        header_layout = QVBoxLayout()
-        header_layout.setSpacing(10)
-        header_layout.setAlignment(Qt.AlignCenter)
+        self.header_layout = _vbox(spacing=10, align=Qt.AlignCenter)
         
-        icon_container = QWidget()
-        icon_layout = QVBoxLayout(icon_container)
-        icon_layout.setAlignment(Qt.AlignCenter)
-        icon_layout.setContentsMargins(0, 0, 0, 0)
-
-        icon_label = QLabel()
-        try:
-            icon_pixmap = QPixmap(resource_path("assets/lms.png"))
-            if not icon_pixmap.isNull():
-                dpr = self.devicePixelRatioF()
-                target_size = QSize(80, 80) * dpr
-                scaled_pixmap = icon_pixmap.scaled(
-                    target_size,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                scaled_pixmap.setDevicePixelRatio(dpr)
-                icon_label.setPixmap(scaled_pixmap)
-                icon_label.setFixedWidth(80)
-            else:
-                icon_label.setText("📚")
-                icon_label.setStyleSheet("font-size: 48px;")
-                icon_label.setAlignment(Qt.AlignCenter)
-        except Exception:
-            icon_label.setText("📚")
-            icon_label.setStyleSheet("font-size: 48px;")
-            icon_label.setAlignment(Qt.AlignCenter)
-
-        icon_layout.addWidget(icon_label)
-        header_layout.addWidget(icon_container)
+        title_text = _TITLES.get(self.user_type, _TITLES["librarian"])
+        self.header_layout.addWidget(_label(title_text, "loginTitle", Qt.AlignCenter))
         
-        title_text = "Reader Login" if self.user_type == "reader" else "Librarian Login"
-        title = QLabel(title_text)
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 28px;
-                font-weight: bold;
-                color: #333;
-                margin: 0;
-                padding: 0;
-            }
-        """)
-        title.setAlignment(Qt.AlignCenter)
-        header_layout.addWidget(title)
+        card_layout.addLayout(self.header_layout)
         
-        subtitle = QLabel("Welcome back! Please sign in to your account")
-        subtitle.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                color: #666;
-                margin: 0;
-                padding: 0;
-            }
-        """)
-        subtitle.setAlignment(Qt.AlignCenter)
-        subtitle.setWordWrap(True)
-        header_layout.addWidget(subtitle)
+        self.form_layout = _vbox(spacing=20)
         
-        card_layout.addLayout(header_layout)
+        username_container = _vbox(spacing=8)
         
-        form_layout = QVBoxLayout()
-        form_layout.setSpacing(20)
-        
-        username_container = QVBoxLayout()
-        username_container.setSpacing(8)
-        
-        username_label = QLabel("Username")
-        username_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                font-weight: 600;
-                color: #333;
-            }
-        """)
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Enter your username")
-        self.username_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border: 1px solid #ddd;
-                border-radius: 6px;
-                font-size: 14px;
-                background: white;
-            }
-            QLineEdit:focus {
-                border: 2px solid #667eea;
-            }
-            QLineEdit:hover {
-                border: 1px solid #bbb;
-            }
-        """)
+        self.username_input.setObjectName("authInput")
         
-        username_container.addWidget(username_label)
+        username_container.addWidget(_label("Username", "fieldLabel"))
         username_container.addWidget(self.username_input)
-        form_layout.addLayout(username_container)
+        self.form_layout.addLayout(username_container)
         
-        password_container = QVBoxLayout()
-        password_container.setSpacing(8)
+        password_container = _vbox(spacing=8)
         
-        password_label = QLabel("Password")
-        password_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                font-weight: 600;
-                color: #333;
-            }
-        """)
         self.password_input = QLineEdit()
         self.password_input.setEchoMode(QLineEdit.Password)
         self.password_input.setPlaceholderText("Enter your password")
-        self.password_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border: 1px solid #ddd;
-                border-radius: 6px;
-                font-size: 14px;
-                background: white;
-            }
-            QLineEdit:focus {
-                border: 2px solid #667eea;
-            }
-            QLineEdit:hover {
-                border: 1px solid #bbb;
-            }
-        """)
+        self.password_input.setObjectName("authInput")
         
-        password_container.addWidget(password_label)
+        password_container.addWidget(_label("Password", "fieldLabel"))
         password_container.addWidget(self.password_input)
-        form_layout.addLayout(password_container)
-        
-        self.error_label = QLabel()
-        self.error_label.setStyleSheet("""
-            QLabel {
-                color: #e74c3c;
-                font-size: 14px;
-                padding: 5px;
-                background-color: #fadbd8;
-                border-radius: 4px;
-                border: 1px solid #e74c3c;
-            }
-        """)
-        self.error_label.hide()
-        form_layout.addWidget(self.error_label)
-        
-        card_layout.addLayout(form_layout)
+        self.form_layout.addLayout(password_container)
         
-        action_layout = QVBoxLayout()
-        action_layout.setSpacing(15)
+        card_layout.addLayout(self.form_layout)
         
-        login_btn = QPushButton("Login")
-        login_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #667eea;
-                color: white;
-                border: none;
-                padding: 12px;
-                border-radius: 6px;
-                font-size: 16px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #5a6fd5;
-            }
-            QPushButton:pressed {
-                background-color: #4a5fc0;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
-        login_btn.setMinimumHeight(45)
-        login_btn.clicked.connect(self.handle_login)
-        action_layout.addWidget(login_btn)
+        self.action_layout = _vbox(spacing=15)
         
-        back_btn = QPushButton("Back to Welcome")
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #667eea;
-                border: 1px solid #667eea;
-                padding: 10px;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #f0f3ff;
-            }
-            QPushButton:pressed {
-                background-color: #e0e7ff;
-            }
-        """)
-        back_btn.setMinimumHeight(40)
-        back_btn.clicked.connect(self.app.switch_to_welcome)
-        action_layout.addWidget(back_btn)
+        self.login_btn = QPushButton("Login")
+        self.login_btn.setObjectName("primaryButton")
+        self.login_btn.setMinimumHeight(45)
+        self.login_btn.clicked.connect(self.handle_login)
+        self.action_layout.addWidget(self.login_btn)
         
-        card_layout.addLayout(action_layout)
+        card_layout.addLayout(self.action_layout)
         
         background_layout.addWidget(card, alignment=Qt.AlignCenter)
         background_layout.addStretch()
         
         main_layout.addWidget(background_frame)
+        self.setStyleSheet(_LOGIN_QSS)
+        
+        # Return / keypad Enter anywhere on the screen submits the form
+        for key in (Qt.Key_Return, Qt.Key_Enter):
+            QShortcut(
+                QKeySequence(key), self,
+                activated=self.handle_login,
+                context=Qt.WidgetWithChildrenShortcut
+            )
+
+    def _build_secondary(self):
+        """Add the logo, subtitle, error label and back button to the built card."""
+        if self.error_label is not None:
+            return
+        
+        icon_container = QWidget()
+        icon_layout = _vbox(icon_container, align=Qt.AlignCenter)
+
+        icon_label = QLabel()
+        icon_pixmap = _logo_pixmap(self.devicePixelRatioF()) if _ICON_EXISTS else None
+        if icon_pixmap is not None and not icon_pixmap.isNull():
+            icon_label.setPixmap(icon_pixmap)
+            icon_label.setFixedWidth(80)
+        else:
+            icon_label.setText("📚")
+            icon_label.setObjectName("loginIconFallback")
+            icon_label.setAlignment(Qt.AlignCenter)
+
+        icon_layout.addWidget(icon_label)
+        self.header_layout.insertWidget(0, icon_container)
         
-        self.username_input.returnPressed.connect(self.handle_login)
-        self.password_input.returnPressed.connect(self.handle_login)
+        self.header_layout.addWidget(_label(
+            "Welcome back! Please sign in to your account",
+            "loginSubtitle", Qt.AlignCenter, word_wrap=True
+        ))
+        
+        self.error_label = _label("", "errorLabel")
+        self.error_label.hide()
+        self.form_layout.addWidget(self.error_label)
+        
+        back_btn = QPushButton("Back to Welcome")
+        back_btn.setObjectName("secondaryButton")
+        back_btn.setMinimumHeight(40)
+        back_btn.clicked.connect(self.app.switch_to_welcome)
+        self.action_layout.addWidget(back_btn)
 
     def show_error(self, message):
         """Display error message to user."""
+        self._build_secondary()
         self.error_label.setText(message)
         self.error_label.show()
 
+    def show_success(self, title, message):
+        """
+        Display a login confirmation, reusing one message box per screen.
+
+        Args:
+            title: Window title
+            message: Confirmation text
+        """
+        if self._success_box is None:
+            self._success_box = QMessageBox(
+                QMessageBox.Information, title, "", QMessageBox.Ok, self
+            )
+        self._success_box.setWindowTitle(title)
+        self._success_box.setText(message)
+        self._success_box.exec()
+
     def hide_error(self):
         """Hide error message."""
-        self.error_label.hide()
+        if self.error_label is not None:
+            self.error_label.hide()
 
     def handle_login(self):
         """Handle login process using User model with demo fallback."""
+        # An authentication is already running; Return presses that arrive
+        # before it finishes must not start a second login
+        if not self.login_btn.isEnabled():
+            return
+
         self.hide_error()
         
         username = self.username_input.text().strip()
@@ -282,8 +402,12 @@ class LoginScreen(QWidget):
             self.show_error("Please enter both username and password.")
             return
 
+        if not _USER_RE.match(username):
+            self.show_error("Invalid username format.")
+            return
+
         try:
-            if username == "demo" and password == "demo":
+            if _is_demo(username, password):
                 mock_user_data = {
                     "id": 999,
                     "username": "demo",
@@ -306,23 +430,54 @@ class LoginScreen(QWidget):
                     self.app.librarian_dashboard.set_username("Demo Librarian")
                     self.app.switch_to_librarian_dashboard()
                 
-                QMessageBox.information(
-                    self, "Demo Login Successful", 
+                self.show_success(
+                    "Demo Login Successful",
                     f"Welcome to the demo, {mock_user_data['full_name']}!\n\n"
                     "This is a demonstration mode with sample data."
                 )
                 return
+        except Exception as e:
+            print(f"Login error: {e}")
+            self.show_error("Database unavailable. Demo mode only.")
+            return
 
-            authenticated_user = User.authenticate(username, password)
-            
-            if authenticated_user and authenticated_user.user_type == self.user_type:
+        # Authenticate on the database thread so hashing and the query
+        # don't block the event loop; _on_auth_result finishes the login
+        self.login_btn.setEnabled(False)
+        run_in_background(
+            User.authenticate, username, password,
+            on_finished=self._on_auth_result
+        )
+
+    @Slot(bool, str, object)
+    def _on_auth_result(self, success, message, authenticated_user):
+        """
+        Complete a login after User.authenticate returns.
+
+        Args:
+            success: False if authentication raised an error
+            message: Error text when success is False
+            authenticated_user: User object, or None for bad credentials
+        """
+        self.login_btn.setEnabled(True)
+
+        if not success:
+            print(f"Login error: {message}")
+            self.show_error(
+                "Login failed due to system error.\n\n"
+                "Try 'demo'/'demo' for demonstration mode."
+            )
+            return
+
+        if authenticated_user and authenticated_user.user_type == self.user_type:
+            try:
                 self.app.current_user = authenticated_user.to_dict()
                 self.app.user_type = self.user_type
-                
+            
                 self.username_input.clear()
                 self.password_input.clear()
                 self.hide_error()
-                
+            
                 if self.user_type == "reader":
                     self.app.reader_dashboard.set_user_info(
                         authenticated_user.username, 
@@ -332,27 +487,23 @@ class LoginScreen(QWidget):
                 else:
                     self.app.librarian_dashboard.set_username(authenticated_user.username)
                     self.app.switch_to_librarian_dashboard()
-                
-                QMessageBox.information(
-                    self, "Login Successful", 
+            
+                self.show_success(
+                    "Login Successful",
                     f"Welcome back, {authenticated_user.full_name}!"
                 )
-            else:
-                if authenticated_user and authenticated_user.user_type != self.user_type:
-                    self.show_error(f"This account is not registered as a {self.user_type}.")
-                else:
-                    self.show_error(
-                        "Invalid username or password.\n\n"
-                        "For testing: Use 'demo' for both username and password.\n"
-                        "Or use the sample accounts created during setup."
-                    )
-                    
-        except Exception as e:
-            print(f"Login error: {e}")
-            if username == "demo" and password == "demo":
-                self.show_error("Database unavailable. Demo mode only.")
-            else:
+            except Exception as e:
+                print(f"Login error: {e}")
                 self.show_error(
                     "Login failed due to system error.\n\n"
                     "Try 'demo'/'demo' for demonstration mode."
-                )
\ No newline at end of file
+                )
+        else:
+            if authenticated_user and authenticated_user.user_type != self.user_type:
+                self.show_error(f"This account is not registered as a {self.user_type}.")
+            else:
+                self.show_error(
+                    "Invalid username or password.\n\n"
+                    "For testing: Use 'demo' for both username and password.\n"
+                    "Or use the sample accounts created during setup."
+                )
@@ -1,15 +1,190 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QLineEdit,
-    QPushButton, QFrame, QHBoxLayout, QMessageBox
+    QPushButton, QFrame, QHBoxLayout, QFormLayout, QSpacerItem,
+    QSizePolicy, QMessageBox
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt, QRegularExpression, Slot
+from PySide6.QtGui import QPixmap, QRegularExpressionValidator, QShortcut, QKeySequence
 from utils import resource_path
-from models.user import User
+from models.user import User, EMAIL_PATTERN
+from modules.db_worker import run_in_background
+
+
+# Stylesheet blocks, keyed to widgets by object name and applied once per screen
+_BACKGROUND_QSS = """
+    QFrame#registerBackground {
+        background: qlineargradient(
+            spread: pad, x1: 0, y1: 0, x2: 1, y2: 1,
+            stop: 0 #667eea, stop: 1 #764ba2
+        );
+        border: none;
+    }
+"""
+
+_CARD_QSS = """
+    QFrame#registerCard {
+        background: white;
+        border-radius: 12px;
+        border: none;
+    }
+"""
+
+_ICON_FALLBACK_QSS = """
+    QLabel#registerIconFallback {
+        font-size: 48px;
+    }
+"""
+
+_TITLE_QSS = """
+    QLabel#registerTitle {
+        font-size: 26px;
+        font-weight: bold;
+        color: #333;
+        margin: 0;
+        padding: 0;
+    }
+"""
+
+_SUBTITLE_QSS = """
+    QLabel#registerSubtitle {
+        font-size: 16px;
+        color: #666;
+        margin: 0;
+        padding: 0;
+    }
+"""
+
+_FIELD_LABEL_QSS = """
+    QLabel#fieldLabel {
+        font-size: 14px;
+        font-weight: 600;
+        color: #333;
+    }
+"""
+
+_INPUT_QSS = """
+    QLineEdit#authInput {
+        padding: 8px;
+        min-height: 25px;
+        border: 1px solid #ddd;
+        border-radius: 6px;
+        font-size: 14px;
+        background: white;
+    }
+    QLineEdit#authInput:focus {
+        border: 2px solid #667eea;
+    }
+    QLineEdit#authInput:hover {
+        border: 1px solid #bbb;
+    }
+"""
+
+_ERROR_QSS = """
+    QLabel#errorLabel {
+        color: #e74c3c;
+        font-size: 14px;
+        padding: 8px;
+        background-color: #fadbd8;
+        border-radius: 4px;
+        border: 1px solid #e74c3c;
+        /* top margin stands in for the gap between form rows */
+        margin: 15px 0 5px 0;
+    }
+"""
+
+_PRIMARY_BUTTON_QSS = """
+    QPushButton#primaryButton {
+        background-color: #667eea;
+        color: white;
+        border: none;
+        padding: 12px;
+        border-radius: 6px;
+        font-size: 16px;
+        font-weight: 600;
+    }
+    QPushButton#primaryButton:hover {
+        background-color: #5a6fd5;
+    }
+    QPushButton#primaryButton:pressed {
+        background-color: #4a5fc0;
+    }
+    QPushButton#primaryButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+"""
+
+_LINK_QSS = """
+    QLabel#linkPrompt {
+        font-size: 14px;
+        color: #666;
+    }
+    QPushButton#linkButton {
+        color: #667eea;
+        font-size: 14px;
+        font-weight: 600;
+        border: none;
+        padding: 0;
+        text-align: left;
+        background: transparent;
+    }
+    QPushButton#linkButton:hover {
+        color: #5a6fd5;
+    }
+    QPushButton#linkButton:pressed {
+        color: #4a5fc0;
+    }
+"""
+
+_SECONDARY_BUTTON_QSS = """
+    QPushButton#secondaryButton {
+        background-color: transparent;
+        color: #667eea;
+        border: 1px solid #667eea;
+        padding: 10px;
+        border-radius: 6px;
+        font-size: 14px;
+    }
+    QPushButton#secondaryButton:hover {
+        background-color: #f0f3ff;
+    }
+    QPushButton#secondaryButton:pressed {
+        background-color: #e0e7ff;
+    }
+"""
+
+# Logo pre-scaled to 70px at 1x, 2x and 3x device pixel ratios, resolved once
+# instead of on every cache miss, and its logical size
+_LOGO_PATHS = {
+    scale: resource_path(f"assets/lms@{scale}x.png") for scale in (1, 2, 3)
+}
+_LOGO_SIZE = 70
+
+# Input patterns for the registration fields. They mirror User.validate so the
+# form only enables "Create Account" once every field would pass it.
+_NAME_PATTERN = r"\s*\S.*\S\s*"
+_USERNAME_PATTERN = r"\s*\S.+\S\s*"
+_PASSWORD_PATTERN = r".{8,}"
+
+# Card title per registration type
+_TITLES = {
+    "reader": "Create Reader Account",
+    "librarian": "Create Librarian Account",
+}
+
+_REGISTER_QSS = "".join((
+    _BACKGROUND_QSS, _CARD_QSS, _ICON_FALLBACK_QSS, _TITLE_QSS, _SUBTITLE_QSS,
+    _FIELD_LABEL_QSS, _INPUT_QSS, _ERROR_QSS, _PRIMARY_BUTTON_QSS, _LINK_QSS,
+    _SECONDARY_BUTTON_QSS
+))
 
 
 class RegisterScreen(QWidget):
     """Registration screen for users and librarians."""
+
+    # Loaded logos keyed by asset scale; unlike QPixmapCache, entries are
+    # never evicted when Qt's own pixmap caching fills the shared budget
+    _LOGO_CACHE = {}
     
     def __init__(self, app, user_type):
         """
@@ -22,37 +197,69 @@ class RegisterScreen(QWidget):
         super().__init__()
         self.app = app
         self.user_type = user_type
-        self.setup_ui()
+        self._built = False
+        self._saving = False
+        self._pending_name = None
+        self._success_box = None
+
+    def showEvent(self, event):
+        """Build the widget tree the first time the screen is shown."""
+        if not self._built:
+            self._built = True
+            self.setup_ui()
+        super().showEvent(event)
+
+    @classmethod
+    def _get_logo_pixmap(cls, dpr):
+        """
+        Get the pre-scaled logo closest to a device pixel ratio, loading it only once.
+
+        Args:
+            dpr: Device pixel ratio of the screen showing the logo
+
+        Returns:
+            QPixmap: The logo, or a null pixmap if it could not be loaded
+        """
+        scale = min(max(round(dpr), 1), 3)
+        pixmap = cls._LOGO_CACHE.get(scale)
+        if pixmap is None:
+            # The assets are already _LOGO_SIZE logical pixels, so there is
+            # no full-size decode and resample at runtime
+            pixmap = QPixmap(_LOGO_PATHS[scale])
+            if not pixmap.isNull():
+                pixmap.setDevicePixelRatio(scale)
+            cls._LOGO_CACHE[scale] = pixmap
+        return pixmap
         
     def setup_ui(self):
         """Set up the graphical user interface for the registration screen."""
+        # Suspend updates so the screen repaints once, not per added widget,
+        # and re-enable them even if building fails part-way
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_ui(self):
+        """Build the background, card, form and action buttons."""
+        # The card is built detached and attached in one step at the end.
+        # Widgets get their final parent up front so adding them to a layout
+        # does not reparent them again.
+        dpr = self.devicePixelRatioF()
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
         
         background_frame = QFrame()
-        background_frame.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(
-                    spread: pad, x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #667eea, stop: 1 #764ba2
-                );
-                border: none;
-            }
-        """)
+        background_frame.setObjectName("registerBackground")
         background_layout = QVBoxLayout(background_frame)
         background_layout.setContentsMargins(20, 20, 20, 20)
         background_layout.setSpacing(0)
         background_layout.addStretch()
         
-        card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background: white;
-                border-radius: 12px;
-                border: none;
-            }
-        """)
+        card = QFrame(background_frame)
+        card.setObjectName("registerCard")
         card.setFixedWidth(500)
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(40, 40, 40, 40)
@@ -62,250 +269,217 @@ class RegisterScreen(QWidget):
         header_layout.setSpacing(10)
         header_layout.setAlignment(Qt.AlignCenter)
         
-        icon_container = QWidget()
+        icon_container = QWidget(card)
         icon_layout = QVBoxLayout(icon_container)
         icon_layout.setAlignment(Qt.AlignCenter)
         icon_layout.setContentsMargins(0, 0, 0, 0)
 
-        icon_label = QLabel()
-        try:
-            icon_pixmap = QPixmap(resource_path("assets/lms.png"))
-            if not icon_pixmap.isNull():
-                dpr = self.devicePixelRatioF()
-                target_size = QSize(70, 70) * dpr
-                scaled_pixmap = icon_pixmap.scaled(
-                    target_size,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                scaled_pixmap.setDevicePixelRatio(dpr)
-                icon_label.setPixmap(scaled_pixmap)
-                icon_label.setFixedWidth(70)
-            else:
-                icon_label.setText("📚")
-                icon_label.setStyleSheet("font-size: 48px;")
-                icon_label.setAlignment(Qt.AlignCenter)
-        except:
+        icon_label = QLabel(icon_container)
+        icon_pixmap = self._get_logo_pixmap(dpr)
+        if not icon_pixmap.isNull():
+            icon_label.setPixmap(icon_pixmap)
+            icon_label.setFixedWidth(_LOGO_SIZE)
+        else:
             icon_label.setText("📚")
-            icon_label.setStyleSheet("font-size: 48px;")
+            icon_label.setObjectName("registerIconFallback")
             icon_label.setAlignment(Qt.AlignCenter)
 
         icon_layout.addWidget(icon_label)
         header_layout.addWidget(icon_container)
         
-        title_text = f"Create {self.user_type.capitalize()} Account"
-        title = QLabel(title_text)
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 26px;
-                font-weight: bold;
-                color: #333;
-                margin: 0;
-                padding: 0;
-            }
-        """)
+        title_text = _TITLES.get(self.user_type)
+        if title_text is None:
+            title_text = f"Create {self.user_type.capitalize()} Account"
+        title = QLabel(title_text, card)
+        title.setObjectName("registerTitle")
         title.setAlignment(Qt.AlignCenter)
         header_layout.addWidget(title)
         
-        subtitle = QLabel("Join our library community today")
-        subtitle.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                color: #666;
-                margin: 0;
-                padding: 0;
-            }
-        """)
+        subtitle = QLabel("Join our library community today", card)
+        subtitle.setObjectName("registerSubtitle")
         subtitle.setAlignment(Qt.AlignCenter)
         subtitle.setWordWrap(True)
         header_layout.addWidget(subtitle)
         
         card_layout.addLayout(header_layout)
         
-        form_layout = QVBoxLayout()
-        form_layout.setSpacing(15)
+        # One form layout with each label wrapped above its field, rather
+        # than a nested QVBoxLayout per field
+        form_layout = QFormLayout()
+        form_layout.setRowWrapPolicy(QFormLayout.WrapAllRows)
+        form_layout.setVerticalSpacing(5)
+        form_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.inputs = {}
-        fields_data = [
-            ("Full Name", "Enter your full name", False),
-            ("Email", "Enter your email address", False),
-            ("Username", "Choose a username", False),
-            ("Password", "Create a password (min 8 chars)", True),
-            ("Confirm Password", "Confirm your password", True)
-        ]
+        self.full_name_edit = self._add_field(
+            form_layout, card, "Full Name", "Enter your full name", _NAME_PATTERN
+        )
+        self.email_edit = self._add_field(
+            form_layout, card, "Email", "Enter your email address", EMAIL_PATTERN
+        )
+        self.username_edit = self._add_field(
+            form_layout, card, "Username", "Choose a username", _USERNAME_PATTERN
+        )
+        self.password_edit = self._add_field(
+            form_layout, card, "Password", "Create a password (min 8 chars)",
+            _PASSWORD_PATTERN, is_password=True
+        )
+        self.confirm_password_edit = self._add_field(
+            form_layout, card, "Confirm Password", "Confirm your password",
+            _PASSWORD_PATTERN, is_password=True
+        )
+        self._fields = (
+            self.full_name_edit, self.email_edit, self.username_edit,
+            self.password_edit, self.confirm_password_edit
+        )
         
-        for label_text, placeholder, is_password in fields_data:
-            field_container = QVBoxLayout()
-            field_container.setSpacing(5)
-            
-            field_label = QLabel(label_text)
-            field_label.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    font-weight: 600;
-                    color: #333;
-                }
-            """)
-            
-            input_field = QLineEdit()
-            input_field.setPlaceholderText(placeholder)
-            input_field.setStyleSheet("""
-                QLineEdit {
-                    padding: 8px;
-                    min-height: 25px;
-                    border: 1px solid #ddd;
-                    border-radius: 6px;
-                    font-size: 14px;
-                    background: white;
-                }
-                QLineEdit:focus {
-                    border: 2px solid #667eea;
-                }
-                QLineEdit:hover {
-                    border: 1px solid #bbb;
-                }
-            """)
-            if is_password:
-                input_field.setEchoMode(QLineEdit.Password)
-            
-            field_container.addWidget(field_label)
-            field_container.addWidget(input_field)
-            form_layout.addLayout(field_container)
-            
-            self.inputs[label_text] = input_field
-        
-        self.error_label = QLabel()
-        self.error_label.setStyleSheet("""
-            QLabel {
-                color: #e74c3c;
-                font-size: 14px;
-                padding: 8px;
-                background-color: #fadbd8;
-                border-radius: 4px;
-                border: 1px solid #e74c3c;
-                margin: 5px 0;
-            }
-        """)
+        self.error_label = QLabel(card)
+        self.error_label.setObjectName("errorLabel")
         self.error_label.hide()
-        form_layout.addWidget(self.error_label)
+        form_layout.addRow(self.error_label)
         
         card_layout.addLayout(form_layout)
         
         action_layout = QVBoxLayout()
         action_layout.setSpacing(12)
         
-        register_btn = QPushButton("Create Account")
-        register_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #667eea;
-                color: white;
-                border: none;
-                padding: 12px;
-                border-radius: 6px;
-                font-size: 16px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #5a6fd5;
-            }
-            QPushButton:pressed {
-                background-color: #4a5fc0;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
-        register_btn.setMinimumHeight(45)
-        register_btn.clicked.connect(self.handle_register)
-        action_layout.addWidget(register_btn)
+        self.register_btn = QPushButton("Create Account", card)
+        self.register_btn.setObjectName("primaryButton")
+        self.register_btn.setMinimumHeight(45)
+        self.register_btn.setEnabled(False)
+        self.register_btn.clicked.connect(self.handle_register)
+        action_layout.addWidget(self.register_btn)
         
         login_layout = QHBoxLayout()
         login_layout.setAlignment(Qt.AlignCenter)
         login_layout.setSpacing(5)
         
-        login_label = QLabel("Already have an account?")
-        login_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                color: #666;
-            }
-        """)
+        login_label = QLabel("Already have an account?", card)
+        login_label.setObjectName("linkPrompt")
         
-        login_btn = QPushButton("Sign In")
+        login_btn = QPushButton("Sign In", card)
         login_btn.setFlat(True)
-        login_btn.setStyleSheet("""
-            QPushButton {
-                color: #667eea;
-                font-size: 14px;
-                font-weight: 600;
-                border: none;
-                padding: 0;
-                text-align: left;
-                background: transparent;
-            }
-            QPushButton:hover {
-                color: #5a6fd5;
-            }
-            QPushButton:pressed {
-                color: #4a5fc0;
-            }
-        """)
-        login_btn.clicked.connect(lambda: self.app.switch_to_login(self.user_type))
+        login_btn.setObjectName("linkButton")
+        login_btn.clicked.connect(self._goto_login)
         
         login_layout.addWidget(login_label)
         login_layout.addWidget(login_btn)
         action_layout.addLayout(login_layout)
         
-        back_btn = QPushButton("Back to Welcome")
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #667eea;
-                border: 1px solid #667eea;
-                padding: 10px;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #f0f3ff;
-            }
-            QPushButton:pressed {
-                background-color: #e0e7ff;
-            }
-        """)
+        back_btn = QPushButton("Back to Welcome", card)
+        back_btn.setObjectName("secondaryButton")
         back_btn.setMinimumHeight(40)
-        back_btn.clicked.connect(self.app.switch_to_welcome)
+        back_btn.clicked.connect(self._goto_welcome)
         action_layout.addWidget(back_btn)
         
         card_layout.addLayout(action_layout)
         
+        # Return / keypad Enter anywhere on the card submits the form
+        for key in (Qt.Key_Return, Qt.Key_Enter):
+            QShortcut(
+                QKeySequence(key), card,
+                activated=self.handle_register,
+                context=Qt.WidgetWithChildrenShortcut
+            )
+        
         background_layout.addWidget(card, alignment=Qt.AlignCenter)
         background_layout.addStretch()
         
         main_layout.addWidget(background_frame)
+        self.setStyleSheet(_REGISTER_QSS)
+
+    def _add_field(self, form_layout, card, label_text, placeholder, pattern, is_password=False):
+        """
+        Add a labelled input row to the registration form.
+
+        Args:
+            form_layout: Form layout receiving the row
+            card: Card widget that parents the label and input
+            label_text: Text shown above the input
+            placeholder: Placeholder text for the input
+            pattern: Regular expression the input must match to be acceptable
+            is_password: Whether to mask the input
+
+        Returns:
+            QLineEdit: The created input
+        """
+        # Labels sit 5px above their fields; a spacer row keeps 15px between fields
+        if form_layout.rowCount():
+            form_layout.addItem(QSpacerItem(0, 5, QSizePolicy.Minimum, QSizePolicy.Fixed))
+        
+        field_label = QLabel(label_text, card)
+        field_label.setObjectName("fieldLabel")
         
-        for input_field in self.inputs.values():
-            input_field.returnPressed.connect(self.handle_register)
+        input_field = QLineEdit(card)
+        input_field.setPlaceholderText(placeholder)
+        input_field.setObjectName("authInput")
+        input_field.setValidator(
+            QRegularExpressionValidator(QRegularExpression(pattern), input_field)
+        )
+        if is_password:
+            input_field.setEchoMode(QLineEdit.Password)
+        input_field.textChanged.connect(self.update_register_enabled)
+        
+        form_layout.addRow(field_label, input_field)
+        return input_field
+
+    @Slot()
+    def _goto_login(self):
+        """Open the login screen for this screen's user type."""
+        self.app.switch_to_login(self.user_type)
+
+    @Slot()
+    def _goto_welcome(self):
+        """Return to the welcome screen."""
+        self.app.switch_to_welcome()
+
+    @Slot()
+    def update_register_enabled(self):
+        """Enable the register button only while every field is acceptable."""
+        self.register_btn.setEnabled(
+            all(input_field.hasAcceptableInput() for input_field in self._fields)
+        )
 
     def show_error(self, message):
         """Display error message to user."""
         self.error_label.setText(message)
         self.error_label.show()
 
+    def show_success(self, title, message):
+        """
+        Display a registration confirmation, reusing one message box per screen.
+
+        Args:
+            title: Window title
+            message: Confirmation text
+        """
+        if self._success_box is None:
+            self._success_box = QMessageBox(
+                QMessageBox.Information, title, "", QMessageBox.Ok, self
+            )
+        self._success_box.setWindowTitle(title)
+        self._success_box.setText(message)
+        self._success_box.exec()
+
     def hide_error(self):
         """Hide error message."""
         self.error_label.hide()
 
+    @Slot()
     def handle_register(self):
         """Handle registration process using User model."""
+        if self._saving:
+            return
         self.hide_error()
         
-        full_name = self.inputs["Full Name"].text().strip()
-        email = self.inputs["Email"].text().strip()
-        username = self.inputs["Username"].text().strip()
-        password = self.inputs["Password"].text()
-        confirm_password = self.inputs["Confirm Password"].text()
+        full_name = self.full_name_edit.text().strip()
+        email = self.email_edit.text().strip()
+        username = self.username_edit.text().strip()
+        password = self.password_edit.text()
+        confirm_password = self.confirm_password_edit.text()
+
+        if not (full_name and email and username and password):
+            self.show_error("Please fill in all fields.")
+            return
 
         if password != confirm_password:
             self.show_error("Passwords do not match.")
@@ -319,25 +493,51 @@ class RegisterScreen(QWidget):
                 password=password,
                 user_type=self.user_type
             )
-            
-            success, result = new_user.save()
-            
-            if success:
-                QMessageBox.information(
-                    self, 
-                    "Registration Successful", 
-                    f"Account created successfully for {full_name}!\n"
-                    f"User ID: {result}\n"
-                    "You can now log in with your credentials."
-                )
-                
-                for input_field in self.inputs.values():
-                    input_field.clear()
-                    
-                self.app.switch_to_login(self.user_type)
-            else:
-                self.show_error(result)
-                
+            is_valid, errors = new_user.validate()
         except Exception as e:
             print(f"Registration error: {e}")
-            self.show_error("Registration failed due to system error. Please try again.")
\ No newline at end of file
+            self.show_error("Registration failed due to system error. Please try again.")
+            return
+
+        # Reject invalid input here rather than queueing a save that would fail
+        if not is_valid:
+            self.show_error("; ".join(errors))
+            return
+
+        # Save on the database thread; _on_register_result finishes the flow
+        self._saving = True
+        self._pending_name = full_name
+        self.register_btn.setEnabled(False)
+        run_in_background(new_user.save, on_finished=self._on_register_result)
+
+    @Slot(bool, str, object)
+    def _on_register_result(self, success, message, result):
+        """
+        Complete a registration after User.save returns.
+
+        Args:
+            success: Whether the user was saved
+            message: Validation or error message when success is False
+            result: New user ID on success; None if the save raised
+        """
+        self._saving = False
+        full_name, self._pending_name = self._pending_name, None
+        self.update_register_enabled()
+
+        if success:
+            self.show_success(
+                "Registration Successful",
+                f"Account created successfully for {full_name}!\n"
+                f"User ID: {result}\n"
+                "You can now log in with your credentials."
+            )
+            
+            for input_field in self._fields:
+                input_field.clear()
+                
+            self.app.switch_to_login(self.user_type)
+        elif result is None:
+            print(f"Registration error: {message}")
+            self.show_error("Registration failed due to system error. Please try again.")
+        else:
+            self.show_error(message)
@@ -1,15 +1,291 @@
+import os
+from functools import partial
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton,
-    QFrame, QHBoxLayout
+    QFrame, QHBoxLayout, QStackedWidget, QSizePolicy
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QPixmap, QImage, QGuiApplication
 from utils import resource_path
+from widgets.gradient_frame import GradientFrame
 from config import Config  
 
 
+# Colours shared by the stylesheet blocks below
+_TOKENS = {
+    "primary": "#667eea",
+    "primary_hover": "#5a6fd5",
+    "primary_pressed": "#4a5fc0",
+    "text_dark": "#2D3748",
+    "text_muted": "#718096",
+    "hover_background": "#F7FAFC",
+}
+
+# Stylesheet blocks, keyed to widgets by object name, rendered once at import
+# and applied once per screen
+_CARD_QSS = """
+    QFrame#welcomeCard {
+        background: white;
+        border-radius: 20px;
+        border: none;
+    }
+"""
+
+_TITLE_QSS = """
+    QLabel#welcomeTitle {{
+        font-size: 32px;
+        font-weight: 700;
+        color: {text_dark};
+        margin: 0;
+        padding: 0;
+    }}
+""".format_map(_TOKENS)
+
+_SUBTITLE_QSS = """
+    QLabel#welcomeSubtitle {{
+        font-size: 18px;
+        color: {text_muted};
+        margin: 0;
+        padding: 0;
+        font-weight: 500;
+    }}
+""".format_map(_TOKENS)
+
+# The app-wide sheet gives every QStackedWidget a gradient; this one sits on the card
+_PANELS_QSS = """
+    QStackedWidget#welcomePanels {
+        background: transparent;
+    }
+"""
+
+_USER_TYPE_BUTTON_QSS = """
+    QPushButton#UserTypeButton {{
+        border: 2px solid #E2E8F0;
+        border-radius: 16px;
+        background-color: #FFFFFF;
+        padding: 10px;
+    }}
+    QPushButton#UserTypeButton:hover {{
+        border: 2px solid {primary};
+        background-color: {hover_background};
+    }}
+    QPushButton#UserTypeButton:pressed {{
+        background-color: #EDF2F7; 
+    }}
+    QLabel#userTypeFallbackIcon {{
+        font-size: 64px;
+        padding: 0;
+        margin: 0;
+    }}
+    QLabel#userTypeText {{
+        font-size: 18px;
+        font-weight: 600;
+        color: {text_dark};
+        margin-top: 8px;
+    }}
+""".format_map(_TOKENS)
+
+_LOGIN_BUTTON_QSS = """
+    QPushButton#welcomeLoginButton {{
+        background-color: {primary};
+        color: white;
+        border: none;
+        padding: 15px 30px;
+        border-radius: 8px;
+        font-size: 16px;
+        font-weight: 600;
+        min-width: 200px;
+    }}
+    QPushButton#welcomeLoginButton:hover {{
+        background-color: {primary_hover};
+    }}
+    QPushButton#welcomeLoginButton:pressed {{
+        background-color: {primary_pressed};
+    }}
+""".format_map(_TOKENS)
+
+_REGISTER_BUTTON_QSS = """
+    QPushButton#welcomeRegisterButton {{
+        background-color: transparent;
+        color: {primary};
+        border: 2px solid {primary};
+        padding: 13px 30px;
+        border-radius: 8px;
+        font-size: 16px;
+        font-weight: 600;
+        min-width: 200px;
+    }}
+    QPushButton#welcomeRegisterButton:hover {{
+        background-color: #f0f3ff;
+    }}
+    QPushButton#welcomeRegisterButton:pressed {{
+        background-color: #e0e7ff;
+    }}
+""".format_map(_TOKENS)
+
+_BACK_BUTTON_QSS = """
+    QPushButton#welcomeBackButton {{
+        background-color: transparent;
+        color: {text_muted};
+        border: none;
+        padding: 10px 20px;
+        font-size: 14px;
+        font-weight: 500;
+        margin-top: 10px;
+    }}
+    QPushButton#welcomeBackButton:hover {{ 
+        color: #4A5568; 
+        background-color: {hover_background};
+        border-radius: 6px;
+    }}
+""".format_map(_TOKENS)
+
+_VERSION_QSS = """
+    QLabel#versionLabel {
+        color: rgba(255, 255, 255, 150);  /* White with 60% opacity */
+        font-style: italic;
+        font-size: 11px;
+        padding: 0;
+        margin: 0;
+    }
+"""
+
+_WELCOME_QSS = "".join((
+    _CARD_QSS, _TITLE_QSS, _SUBTITLE_QSS, _PANELS_QSS, _USER_TYPE_BUTTON_QSS,
+    _LOGIN_BUTTON_QSS, _REGISTER_BUTTON_QSS, _BACK_BUTTON_QSS, _VERSION_QSS
+))
+
+# User-type icons and their logical size on the selection buttons
+_READER_ICON = "assets/Reader_Icon.png"
+_LIBRARIAN_ICON = "assets/Librarian_Icon.png"
+_ICON_SIZE = 90
+
+# Subtitle before a user type is picked, and once it has been
+_DEFAULT_SUBTITLE = "Your Gateway to Knowledge"
+_SUBTITLES = {
+    "reader": "Welcome, Reader. Please select an option.",
+    "librarian": "Welcome, Librarian. Please select an option.",
+}
+
+# Shown in place of a user-type icon that could not be loaded
+_FALLBACK_EMOJI = {
+    "Reader": "👤",
+    "Librarian": "📊",
+}
+
+# Device pixel ratios with a pre-scaled copy of each icon next to it, named
+# e.g. Reader_Icon@1.5x.png; each copy is _ICON_SIZE times the ratio, produced
+# once from the full-size icon with QImage.scaled(..., Qt.SmoothTransformation)
+_ICON_SCALES = (1, 1.5, 2, 3)
+
+
+def _load_icon_image(icon_path, dpr):
+    """
+    Load a user-type icon for a device pixel ratio.
+
+    Uses the pre-scaled copy nearest to dpr, leaving any residual scaling to
+    the painter; if that copy is missing, the full-size icon is smooth-scaled.
+
+    Args:
+        icon_path: Icon path relative to the application root
+        dpr: Device pixel ratio of the screen showing the icon
+
+    Returns:
+        QImage: The icon with its device pixel ratio set, or a null image
+    """
+    scale = min(_ICON_SCALES, key=lambda s: abs(s - dpr))
+    stem, ext = os.path.splitext(icon_path)
+    image = QImage(resource_path(f"{stem}@{scale:g}x{ext}"))
+    if image.isNull():
+        scale = dpr
+        image = QImage(resource_path(icon_path))
+        if not image.isNull():
+            image = image.scaled(
+                QSize(_ICON_SIZE, _ICON_SIZE) * dpr,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+    image.setDevicePixelRatio(scale)
+    return image
+
+
+class _IconPreloaderSignals(QObject):
+    """Signals emitted by an _IconPreloader; delivered on the GUI thread."""
+
+    loaded = Signal(str, float, QImage)
+
+
+class _IconPreloader(QRunnable):
+    """Runnable that loads a user-type icon off the GUI thread."""
+
+    def __init__(self, icon_path, dpr):
+        """
+        Initialize the preloader.
+
+        Args:
+            icon_path: Icon path relative to the application root
+            dpr: Device pixel ratio to scale the icon for
+        """
+        super().__init__()
+        self.icon_path = icon_path
+        self.dpr = dpr
+        self.signals = _IconPreloaderSignals()
+
+    def run(self):
+        """Load the icon into a QImage, which unlike QPixmap is thread-safe."""
+        self.signals.loaded.emit(
+            self.icon_path, self.dpr, _load_icon_image(self.icon_path, self.dpr)
+        )
+
+
+_preload_pool = None
+
+# Runnables kept referenced until their icon has been delivered
+_preloaders = []
+
+
+def _store_preloaded_icon(preloader, icon_path, dpr, image):
+    """
+    Cache an icon decoded by a preloader, on the GUI thread.
+
+    Args:
+        preloader: The _IconPreloader that produced the image
+        icon_path: Icon path relative to the application root
+        dpr: Device pixel ratio the icon was scaled for
+        image: The decoded icon
+    """
+    _preloaders.remove(preloader)
+    # A screen built before the preload finished has already loaded its own
+    WelcomeScreen._PIXMAP_CACHE.setdefault((icon_path, dpr), QPixmap.fromImage(image))
+
+
+def preload_welcome_assets():
+    """
+    Start decoding the user-type icons on a background pool.
+
+    Call once after the QApplication exists and before WelcomeScreen is built,
+    so the decode overlaps with the rest of startup (e.g. connecting to the
+    database) instead of blocking the first screen.
+    """
+    global _preload_pool
+    if _preload_pool is not None:
+        return
+    dpr = QGuiApplication.primaryScreen().devicePixelRatio()
+    _preload_pool = QThreadPool()
+    for icon_path in (_READER_ICON, _LIBRARIAN_ICON):
+        preloader = _IconPreloader(icon_path, dpr)
+        preloader.setAutoDelete(False)
+        preloader.signals.loaded.connect(partial(_store_preloaded_icon, preloader))
+        _preloaders.append(preloader)
+        _preload_pool.start(preloader)
+
+
 class WelcomeScreen(QWidget):
     """Welcome screen for the Library Management System."""
+
+    # Scaled user-type icons keyed by (icon_path, device pixel ratio), shared
+    # by every WelcomeScreen so each icon is loaded and smooth-scaled once
+    _PIXMAP_CACHE = {}
     
     def __init__(self, app):
         super().__init__()
@@ -19,35 +295,19 @@ class WelcomeScreen(QWidget):
 
     def setup_ui(self):
         """Setup the user interface."""
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
         
-        background_frame = QFrame()
-        background_frame.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(
-                    spread: pad, x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #667eea, stop: 1 #764ba2
-                );
-                border: none;
-            }
-        """)
+        background_frame = GradientFrame()
         background_layout = QVBoxLayout(background_frame)
         background_layout.setContentsMargins(40, 60, 40, 60)
         background_layout.setSpacing(0)
         background_layout.addStretch()
         
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background: white;
-                border-radius: 20px;
-                border: none;
-            }
-        """)
+        card.setObjectName("welcomeCard")
+        self.card = card
         card.setMinimumWidth(750)
         card.setMaximumWidth(900)
         card_layout = QVBoxLayout(card)
@@ -59,134 +319,69 @@ class WelcomeScreen(QWidget):
         header_layout.setAlignment(Qt.AlignCenter)
         
         title = QLabel("Library Management System")
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 32px;
-                font-weight: 700;
-                color: #2D3748;
-                margin: 0;
-                padding: 0;
-            }
-        """)
+        title.setObjectName("welcomeTitle")
         title.setAlignment(Qt.AlignCenter)
         header_layout.addWidget(title)
         
-        self.subtitle_label = QLabel("Your Gateway to Knowledge")
-        self.subtitle_label.setStyleSheet("""
-            QLabel {
-                font-size: 18px;
-                color: #718096;
-                margin: 0;
-                padding: 0;
-                font-weight: 500;
-            }
-        """)
+        self.subtitle_label = QLabel(_DEFAULT_SUBTITLE)
+        self.subtitle_label.setObjectName("welcomeSubtitle")
         self.subtitle_label.setAlignment(Qt.AlignCenter)
         self.subtitle_label.setWordWrap(True)
         header_layout.addWidget(self.subtitle_label)
         
         card_layout.addLayout(header_layout)
         
-        self.initial_layout = QHBoxLayout()
+        # The user-type buttons and the login/register actions are two pages
+        # of one stack, so switching between them is a single page change
+        self.panel_stack = QStackedWidget()
+        self.panel_stack.setObjectName("welcomePanels")
+        
+        initial_panel = QWidget()
+        self.initial_layout = QHBoxLayout(initial_panel)
+        self.initial_layout.setContentsMargins(0, 0, 0, 0)
         self.initial_layout.setSpacing(30)
         self.initial_layout.setAlignment(Qt.AlignCenter)
         
-        self.reader_btn = self.create_user_type_button("Reader", "assets/Reader_Icon.png")
-        self.reader_btn.clicked.connect(lambda: self.select_user_type("reader"))
+        self.reader_btn = self.create_user_type_button("Reader", _READER_ICON)
+        self.reader_btn.clicked.connect(partial(self.select_user_type, "reader"))
         self.initial_layout.addWidget(self.reader_btn)
 
-        self.librarian_btn = self.create_user_type_button("Librarian", "assets/Librarian_Icon.png")
-        self.librarian_btn.clicked.connect(lambda: self.select_user_type("librarian"))
+        self.librarian_btn = self.create_user_type_button("Librarian", _LIBRARIAN_ICON)
+        self.librarian_btn.clicked.connect(partial(self.select_user_type, "librarian"))
         self.initial_layout.addWidget(self.librarian_btn)
         
-        card_layout.addLayout(self.initial_layout)
+        self.panel_stack.addWidget(initial_panel)
         
-        self.action_layout = QVBoxLayout()
+        action_panel = QWidget()
+        self.action_layout = QVBoxLayout(action_panel)
+        self.action_layout.setContentsMargins(0, 0, 0, 0)
         self.action_layout.setSpacing(15)
         self.action_layout.setAlignment(Qt.AlignCenter)
         
         self.login_btn = QPushButton("Login")
-        self.login_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #667eea;
-                color: white;
-                border: none;
-                padding: 15px 30px;
-                border-radius: 8px;
-                font-size: 16px;
-                font-weight: 600;
-                min-width: 200px;
-            }
-            QPushButton:hover {
-                background-color: #5a6fd5;
-            }
-            QPushButton:pressed {
-                background-color: #4a5fc0;
-            }
-        """)
+        self.login_btn.setObjectName("welcomeLoginButton")
         self.login_btn.setMinimumHeight(50)
         self.login_btn.clicked.connect(self.handle_login_click)
-        self.login_btn.hide()
         self.action_layout.addWidget(self.login_btn)
         
         self.register_btn = QPushButton("Register")
-        self.register_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #667eea;
-                border: 2px solid #667eea;
-                padding: 13px 30px;
-                border-radius: 8px;
-                font-size: 16px;
-                font-weight: 600;
-                min-width: 200px;
-            }
-            QPushButton:hover {
-                background-color: #f0f3ff;
-            }
-            QPushButton:pressed {
-                background-color: #e0e7ff;
-            }
-        """)
+        self.register_btn.setObjectName("welcomeRegisterButton")
         self.register_btn.setMinimumHeight(50)
         self.register_btn.clicked.connect(self.handle_register_click)
-        self.register_btn.hide()
         self.action_layout.addWidget(self.register_btn)
         
         self.back_btn = QPushButton("← Back to Selection")
-        self.back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #718096;
-                border: none;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: 500;
-                margin-top: 10px;
-            }
-            QPushButton:hover { 
-                color: #4A5568; 
-                background-color: #F7FAFC;
-                border-radius: 6px;
-            }
-        """)
+        self.back_btn.setObjectName("welcomeBackButton")
         self.back_btn.clicked.connect(self.go_back)
-        self.back_btn.hide()
         self.action_layout.addWidget(self.back_btn)
         
-        card_layout.addLayout(self.action_layout)
+        self.panel_stack.addWidget(action_panel)
+        self.show_panel(0)
+        card_layout.addWidget(self.panel_stack)
         
         # Add version label at the bottom of the card
         version_label = QLabel(Config.VERSION)
-        version_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 150);  /* White with 60% opacity */
-                font-style: italic;
-                font-size: 11px;
-                padding: 0;
-                margin: 0;
-            }
-        """)
+        version_label.setObjectName("versionLabel")
         version_label.setAlignment(Qt.AlignCenter)
         card_layout.addWidget(version_label)
         
@@ -194,6 +389,28 @@ class WelcomeScreen(QWidget):
         background_layout.addStretch()
         
         main_layout.addWidget(background_frame)
+        self.setStyleSheet(_WELCOME_QSS)
+
+    @classmethod
+    def _get_icon_pixmap(cls, icon_path, dpr):
+        """
+        Get a user-type icon for a device pixel ratio, loading it only once.
+
+        Args:
+            icon_path: Icon path relative to the application root
+            dpr: Device pixel ratio of the screen showing the icon
+
+        Returns:
+            QPixmap: The icon, or a null pixmap if it could not be loaded
+        """
+        key = (icon_path, dpr)
+        pixmap = cls._PIXMAP_CACHE.get(key)
+        if pixmap is None:
+            # Not preloaded yet: load just this icon rather than wait for the
+            # preload pool; a preload finishing later keeps this copy
+            pixmap = QPixmap.fromImage(_load_icon_image(icon_path, dpr))
+            cls._PIXMAP_CACHE[key] = pixmap
+        return pixmap
 
     def create_user_type_button(self, text, icon_path):
         """Create a user type selection button."""
@@ -208,87 +425,55 @@ class WelcomeScreen(QWidget):
 
         icon_label = QLabel()
         icon_label.setAlignment(Qt.AlignCenter)
+        icon_label.setFixedSize(_ICON_SIZE, _ICON_SIZE)
         
         try:
-            pixmap = QPixmap(resource_path(icon_path))
-            if not pixmap.isNull():
-                dpr = self.devicePixelRatioF()
-                target_size = QSize(90, 90) * dpr
-                scaled_pixmap = pixmap.scaled(
-                    target_size,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                scaled_pixmap.setDevicePixelRatio(dpr)
-                icon_label.setPixmap(scaled_pixmap)
-                icon_label.setFixedSize(90, 90)
-            else:
-                fallback_text = "👤" if "Reader" in text else "📊"
-                icon_label.setText(fallback_text)
-                icon_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 64px;
-                        padding: 0;
-                        margin: 0;
-                    }
-                """)
-                icon_label.setFixedSize(90, 90)
+            pixmap = self._get_icon_pixmap(icon_path, self.devicePixelRatioF())
         except Exception as e:
             print(f"Error loading image {icon_path}: {e}")
-            fallback_text = "👤" if "Reader" in text else "📊"
-            icon_label.setText(fallback_text)
-            icon_label.setStyleSheet("""
-                QLabel {
-                    font-size: 64px;
-                    padding: 0;
-                    margin: 0;
-                }
-            """)
-            icon_label.setFixedSize(90, 90)
+            pixmap = None
+
+        if pixmap is not None and not pixmap.isNull():
+            icon_label.setPixmap(pixmap)
+        else:
+            icon_label.setText(_FALLBACK_EMOJI[text])
+            icon_label.setObjectName("userTypeFallbackIcon")
 
         text_label = QLabel(text)
         text_label.setAlignment(Qt.AlignCenter)
-        text_label.setStyleSheet("""
-            QLabel {
-                font-size: 18px;
-                font-weight: 600;
-                color: #2D3748;
-                margin-top: 8px;
-            }
-        """)
+        text_label.setObjectName("userTypeText")
 
         layout.addWidget(icon_label)
         layout.addWidget(text_label)
 
-        button.setStyleSheet("""
-            QPushButton#UserTypeButton {
-                border: 2px solid #E2E8F0;
-                border-radius: 16px;
-                background-color: #FFFFFF;
-                padding: 10px;
-            }
-            QPushButton#UserTypeButton:hover {
-                border: 2px solid #667eea;
-                background-color: #F7FAFC;
-            }
-            QPushButton#UserTypeButton:pressed {
-                background-color: #EDF2F7; 
-            }
-        """)
         return button
 
+    def show_panel(self, index):
+        """
+        Show one page of the panel stack and size the card to it.
+
+        A stack is normally as tall as its tallest page; ignoring the hidden
+        page's height lets the card shrink to fit the visible one.
+
+        Args:
+            index: 0 for the user-type buttons, 1 for the login/register actions
+        """
+        for page_index in range(self.panel_stack.count()):
+            self.panel_stack.widget(page_index).setSizePolicy(
+                QSizePolicy.Preferred,
+                QSizePolicy.Preferred if page_index == index else QSizePolicy.Ignored
+            )
+        self.panel_stack.setCurrentIndex(index)
+
     def select_user_type(self, user_type):
         """Handle user type selection."""
         self.user_type = user_type
 
-        self.reader_btn.hide()
-        self.librarian_btn.hide()
-
-        self.login_btn.show()
-        self.register_btn.show()
-        self.back_btn.show()
-
-        self.subtitle_label.setText(f"Welcome, {self.user_type.capitalize()}. Please select an option.")
+        # Swap the card's contents with updates off so it repaints once
+        self.card.setUpdatesEnabled(False)
+        self.show_panel(1)
+        self.subtitle_label.setText(_SUBTITLES[user_type])
+        self.card.setUpdatesEnabled(True)
 
     def handle_login_click(self):
         """Handle login button click."""
@@ -304,11 +489,7 @@ class WelcomeScreen(QWidget):
         """Go back to user type selection."""
         self.user_type = None
         
-        self.reader_btn.show()
-        self.librarian_btn.show()
-        
-        self.login_btn.hide()
-        self.register_btn.hide()
-        self.back_btn.hide()
-
-        self.subtitle_label.setText("Your Gateway to Knowledge")
\ No newline at end of file
+        self.card.setUpdatesEnabled(False)
+        self.show_panel(0)
+        self.subtitle_label.setText(_DEFAULT_SUBTITLE)
+        self.card.setUpdatesEnabled(True)
\ No newline at end of file
@@ -145,84 +145,6 @@ class LibrarianDashboard(QWidget):
         """)
         return search_input
 
-    @staticmethod
-    def create_action_cell(buttons):
-        """Create action button cell for tables."""
-        from PySide6.QtWidgets import QWidget, QHBoxLayout
-        
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(8, 3, 8, 3)
-        layout.setSpacing(10)
-        layout.setAlignment(Qt.AlignCenter)
-        
-        if len(buttons) == 1:
-            button_width = 75
-            container_width = 95
-        elif len(buttons) == 2:
-            button_width = 62
-            container_width = 150
-        else:
-            button_width = 48
-            container_width = 165
-        
-        for button in buttons:
-            button.setFixedSize(button_width, 30)
-            button_text = button.text()
-            
-            if "Delete" in button_text:
-                button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #dc2626;
-                        color: white;
-                        border: none;
-                        border-radius: 5px;
-                        font-size: 11px;
-                        font-weight: 600;
-                        padding: 0px;
-                        margin: 0px;
-                    }
-                    QPushButton:hover {
-                        background-color: #b91c1c;
-                    }
-                """)
-            elif "Edit" in button_text:
-                button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2563eb;
-                        color: white;
-                        border: none;
-                        border-radius: 5px;
-                        font-size: 11px;
-                        font-weight: 600;
-                        padding: 0px;
-                        margin: 0px;
-                    }
-                    QPushButton:hover {
-                        background-color: #1e40af;
-                    }
-                """)
-            elif "Return" in button_text:
-                button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #16a34a;
-                        color: white;
-                        border: none;
-                        border-radius: 5px;
-                        font-size: 11px;
-                        font-weight: 600;
-                        padding: 0px;
-                        margin: 0px;
-                    }
-                    QPushButton:hover {
-                        background-color: #15803d;
-                    }
-                """)
-            layout.addWidget(button)
-        
-        container.setFixedWidth(container_width)
-        return container
-
     def refresh_all_tabs(self):
         """Refresh data in all tabs."""
         if hasattr(self, 'book_tab'):
@@ -1,11 +1,13 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, QHeaderView, QFrame, QMessageBox, QSizePolicy
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from styles.style_manager import StyleManager
+from widgets.row_action_delegate import RowActionDelegate, RECORD_ROLE, ACTIONS_ROLE
 from screens.librarian.dialogs.book_form_dialog import BookFormDialog
 
 # Import modules
 from modules.add_recs import AddRecordsModule
 from modules.view_recs import ViewRecordsModule
+from modules.db_worker import run_in_background
 from modules.update_recs import UpdateRecordsModule
 from modules.delete_recs import DeleteRecordsModule
 from modules.search_recs import SearchRecordsModule
@@ -55,6 +57,9 @@ class BookTab(QWidget):
         
         self._style_table_common(self.books_table)
         self.books_table.setColumnWidth(6, 200)
+        self.action_delegate = RowActionDelegate(self.books_table)
+        self.action_delegate.action_triggered.connect(self.handle_row_action)
+        self.books_table.setItemDelegateForColumn(6, self.action_delegate)
         self.books_table.setFocusPolicy(Qt.StrongFocus)
         
         layout.addWidget(self._wrap_table_in_frame(self.books_table))
@@ -133,15 +138,17 @@ class BookTab(QWidget):
         if not self.books_table:
             return
             
+        # Fill every row with repaints suspended and the row count set once,
+        # so the table lays out and paints once instead of per inserted row
+        self.books_table.setUpdatesEnabled(False)
         try:
             # Sort books by ID in descending order (latest first)
             sorted_books = sorted(books, key=lambda x: x.id, reverse=True)
             
             self.books_table.setRowCount(0)
-                        
+            self.books_table.setRowCount(len(sorted_books))
+            
             for row, book in enumerate(sorted_books):
-                self.books_table.insertRow(row)
-                                
                 columns = [
                     str(book.id),
                     book.title,
@@ -156,38 +163,61 @@ class BookTab(QWidget):
                     item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
                     self.books_table.setItem(row, col, item)
                 
-                edit_btn = QPushButton("Edit")
-                delete_btn = QPushButton("Delete")
-                
-                edit_btn.clicked.connect(lambda checked, b=book: self.edit_book(b))
-                delete_btn.clicked.connect(lambda checked, b=book: self.delete_book(b))
-                
-                # Use centralized method from parent dashboard
-                action_cell = self.parent.create_action_cell([edit_btn, delete_btn])
-                self.books_table.setCellWidget(row, 6, action_cell)
+                # The action delegate draws the buttons from the item's data
+                action_item = QTableWidgetItem()
+                action_item.setData(RECORD_ROLE, book)
+                action_item.setData(ACTIONS_ROLE, ("Edit", "Delete"))
+                self.books_table.setItem(row, 6, action_item)
 
         except Exception as e:
             print(f"Error displaying books: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            self.books_table.setUpdatesEnabled(True)
+
+    def handle_row_action(self, action, book):
+        """
+        Run the action for a clicked row button.
+
+        Args:
+            action: Label of the clicked button
+            book: Book shown in the button's row
+        """
+        if action == "Edit":
+            self.edit_book(book)
+        elif action == "Delete":
+            self.delete_book(book)
 
     def load_books_data(self):
-        """Load books data using ViewRecordsModule."""
-        try:
-            # Use view module to get all books
-            success, result = ViewRecordsModule.get_all_books()
-            
-            if success:
-                self.all_books = result
-                self.display_books(self.all_books)
-            else:
-                QMessageBox.warning(self, "Error", result)
-                
-        except Exception as e:
-            print(f"Error loading books data: {e}")
-            import traceback
-            traceback.print_exc()
-            QMessageBox.warning(self, "Error", f"Failed to load books: {str(e)}")
+        """Load books data using ViewRecordsModule on the database thread."""
+        # The query runs off the GUI thread so the dashboard keeps painting;
+        # _on_books_loaded fills the table once the books arrive
+        run_in_background(
+            ViewRecordsModule.get_all_books,
+            on_finished=self._on_books_loaded
+        )
+
+    @Slot(bool, str, object)
+    def _on_books_loaded(self, success, message, books):
+        """
+        Display the books fetched by load_books_data.
+
+        Args:
+            success: Whether the books were loaded
+            message: Error message when success is False
+            books: List of book objects on success
+        """
+        # The tab may have been cleaned up while the query was running
+        if not self.books_table:
+            return
+
+        if success:
+            self.all_books = books
+            self.display_books(self.all_books)
+        else:
+            print(f"Error loading books data: {message}")
+            QMessageBox.warning(self, "Error", message or "Failed to load books")
 
     def add_book(self):
         """Add new book using AddRecordsModule."""
@@ -1,10 +1,12 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, QHeaderView, QFrame, QMessageBox, QSizePolicy
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtGui import QColor
 from styles.style_manager import StyleManager
+from widgets.row_action_delegate import RowActionDelegate, RECORD_ROLE, ACTIONS_ROLE
 
 # Import modules
 from modules.view_recs import ViewRecordsModule
+from modules.db_worker import run_in_background
 from modules.update_recs import UpdateRecordsModule
 from modules.delete_recs import DeleteRecordsModule
 from modules.search_recs import SearchRecordsModule
@@ -54,6 +56,9 @@ class LoanTab(QWidget):
         
         self._style_table_common(self.loans_table)
         self.loans_table.setColumnWidth(6, 200)
+        self.action_delegate = RowActionDelegate(self.loans_table)
+        self.action_delegate.action_triggered.connect(self.handle_row_action)
+        self.loans_table.setItemDelegateForColumn(6, self.action_delegate)
         self.loans_table.setFocusPolicy(Qt.StrongFocus)
         
         layout.addWidget(self._wrap_table_in_frame(self.loans_table))
@@ -132,15 +137,17 @@ class LoanTab(QWidget):
         if not self.loans_table:
             return
             
+        # Fill every row with repaints suspended and the row count set once,
+        # so the table lays out and paints once instead of per inserted row
+        self.loans_table.setUpdatesEnabled(False)
         try:
             # Sort loans by ID in descending order (latest first)
             sorted_loans = sorted(loans, key=lambda x: x.id, reverse=True)
             
             self.loans_table.setRowCount(0)
+            self.loans_table.setRowCount(len(sorted_loans))
             
             for row_idx, loan in enumerate(sorted_loans):
-                self.loans_table.insertRow(row_idx)
-                
                 book = loan.get_book()
                 user = loan.get_user()
                 
@@ -150,7 +157,7 @@ class LoanTab(QWidget):
                     user.username if user else "Unknown User",
                     loan.loan_date,
                     loan.due_date,
-                    loan.update_status().capitalize()
+                    loan.status.capitalize()
                 ]
                 
                 for col, value in enumerate(columns):
@@ -167,39 +174,63 @@ class LoanTab(QWidget):
                     
                     self.loans_table.setItem(row_idx, col, item)
 
-                buttons = []
-                if not loan.return_date:
-                    ret_btn = QPushButton("Return")
-                    ret_btn.clicked.connect(lambda checked, l=loan: self.mark_loan_returned(l))
-                    buttons.append(ret_btn)
-
-                del_btn = QPushButton("Delete")
-                del_btn.clicked.connect(lambda checked, l=loan: self.delete_loan(l))
-                buttons.append(del_btn)
-
-                # Use centralized method from parent dashboard
-                cell = self.parent.create_action_cell(buttons)
-                self.loans_table.setCellWidget(row_idx, 6, cell)
+                # The action delegate draws the buttons from the item's data;
+                # returned loans can only be deleted
+                action_item = QTableWidgetItem()
+                action_item.setData(RECORD_ROLE, loan)
+                action_item.setData(
+                    ACTIONS_ROLE, ("Delete",) if loan.return_date else ("Return", "Delete")
+                )
+                self.loans_table.setItem(row_idx, 6, action_item)
         except Exception as e:
             print(f"Error displaying loans: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            self.loans_table.setUpdatesEnabled(True)
+
+    def handle_row_action(self, action, loan):
+        """
+        Run the action for a clicked row button.
+
+        Args:
+            action: Label of the clicked button
+            loan: Loan shown in the button's row
+        """
+        if action == "Return":
+            self.mark_loan_returned(loan)
+        elif action == "Delete":
+            self.delete_loan(loan)
 
     def load_loans_data(self):
-        """Load loans data using ViewRecordsModule."""
-        try:
-            # Use view module to get all loans
-            success, result = ViewRecordsModule.get_all_loans()
-            
-            if success:
-                self.all_loans = result
-                self.display_loans(self.all_loans)
-            else:
-                QMessageBox.warning(self, "Error", result)
-                
-        except Exception as e:
-            print(f"Error loading loans data: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to load loans: {str(e)}")
+        """Load loans data using ViewRecordsModule on the database thread."""
+        # The query runs off the GUI thread so the dashboard keeps painting;
+        # _on_loans_loaded fills the table once the loans arrive
+        run_in_background(
+            ViewRecordsModule.get_all_loans,
+            on_finished=self._on_loans_loaded
+        )
+
+    @Slot(bool, str, object)
+    def _on_loans_loaded(self, success, message, loans):
+        """
+        Display the loans fetched by load_loans_data.
+
+        Args:
+            success: Whether the loans were loaded
+            message: Error message when success is False
+            loans: List of loan objects on success
+        """
+        # The tab may have been cleaned up while the query was running
+        if not self.loans_table:
+            return
+
+        if success:
+            self.all_loans = loans
+            self.display_loans(self.all_loans)
+        else:
+            print(f"Error loading loans data: {message}")
+            QMessageBox.warning(self, "Error", message or "Failed to load loans")
 
     def mark_loan_returned(self, loan=None):
         """Mark loan as returned using UpdateRecordsModule."""
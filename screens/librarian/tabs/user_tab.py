@@ -1,11 +1,13 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, QHeaderView, QFrame, QMessageBox, QSizePolicy
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from styles.style_manager import StyleManager
+from widgets.row_action_delegate import RowActionDelegate, RECORD_ROLE, ACTIONS_ROLE
 from screens.librarian.dialogs.user_form_dialog import UserFormDialog
 
 # Import modules
 from modules.add_recs import AddRecordsModule
 from modules.view_recs import ViewRecordsModule
+from modules.db_worker import run_in_background
 from modules.update_recs import UpdateRecordsModule
 from modules.delete_recs import DeleteRecordsModule
 from modules.search_recs import SearchRecordsModule
@@ -55,6 +57,9 @@ class UserTab(QWidget):
         
         self._style_table_common(self.users_table)
         self.users_table.setColumnWidth(5, 200)
+        self.action_delegate = RowActionDelegate(self.users_table)
+        self.action_delegate.action_triggered.connect(self.handle_row_action)
+        self.users_table.setItemDelegateForColumn(5, self.action_delegate)
         self.users_table.setFocusPolicy(Qt.StrongFocus)
         
         layout.addWidget(self._wrap_table_in_frame(self.users_table))
@@ -133,15 +138,17 @@ class UserTab(QWidget):
         if not self.users_table:
             return
             
+        # Fill every row with repaints suspended and the row count set once,
+        # so the table lays out and paints once instead of per inserted row
+        self.users_table.setUpdatesEnabled(False)
         try:
             # Sort users by ID in descending order (latest first)
             sorted_users = sorted(users, key=lambda x: x.id, reverse=True)
             
             self.users_table.setRowCount(0)
+            self.users_table.setRowCount(len(sorted_users))
             
             for row_idx, user in enumerate(sorted_users):
-                self.users_table.insertRow(row_idx)
-                
                 columns = [
                     str(user.id),
                     user.full_name,
@@ -155,35 +162,60 @@ class UserTab(QWidget):
                     item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
                     self.users_table.setItem(row_idx, col, item)
 
-                edit_btn = QPushButton("Edit")
-                delete_btn = QPushButton("Delete")
-
-                edit_btn.clicked.connect(lambda _, u=user: self.edit_user(u))
-                delete_btn.clicked.connect(lambda _, u=user: self.delete_user(u))
-
-                # Use centralized method from parent dashboard
-                cell = self.parent.create_action_cell([edit_btn, delete_btn])
-                self.users_table.setCellWidget(row_idx, 5, cell)
+                # The action delegate draws the buttons from the item's data
+                action_item = QTableWidgetItem()
+                action_item.setData(RECORD_ROLE, user)
+                action_item.setData(ACTIONS_ROLE, ("Edit", "Delete"))
+                self.users_table.setItem(row_idx, 5, action_item)
         except Exception as e:
             print(f"Error displaying users: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            self.users_table.setUpdatesEnabled(True)
+
+    def handle_row_action(self, action, user):
+        """
+        Run the action for a clicked row button.
+
+        Args:
+            action: Label of the clicked button
+            user: User shown in the button's row
+        """
+        if action == "Edit":
+            self.edit_user(user)
+        elif action == "Delete":
+            self.delete_user(user)
 
     def load_users_data(self):
-        """Load users data using ViewRecordsModule."""
-        try:
-            # Use view module to get all users
-            success, result = ViewRecordsModule.get_all_users()
-            
-            if success:
-                self.all_users = result
-                self.display_users(self.all_users)
-            else:
-                QMessageBox.warning(self, "Error", result)
-                
-        except Exception as e:
-            print(f"Error loading users data: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to load users: {str(e)}")
+        """Load users data using ViewRecordsModule on the database thread."""
+        # The query runs off the GUI thread so the dashboard keeps painting;
+        # _on_users_loaded fills the table once the users arrive
+        run_in_background(
+            ViewRecordsModule.get_all_users,
+            on_finished=self._on_users_loaded
+        )
+
+    @Slot(bool, str, object)
+    def _on_users_loaded(self, success, message, users):
+        """
+        Display the users fetched by load_users_data.
+
+        Args:
+            success: Whether the users were loaded
+            message: Error message when success is False
+            users: List of user objects on success
+        """
+        # The tab may have been cleaned up while the query was running
+        if not self.users_table:
+            return
+
+        if success:
+            self.all_users = users
+            self.display_users(self.all_users)
+        else:
+            print(f"Error loading users data: {message}")
+            QMessageBox.warning(self, "Error", message or "Failed to load users")
 
     def add_user(self):
         """Add new user using AddRecordsModule."""
@@ -0,0 +1,29 @@
+from PySide6.QtWidgets import QFrame
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QPainter, QLinearGradient, QGradient, QColor
+
+
+class GradientFrame(QFrame):
+    """Frame that paints a diagonal gradient behind its children without a stylesheet."""
+
+    def __init__(self, start_color="#667eea", end_color="#764ba2", parent=None):
+        """
+        Initialize the GradientFrame.
+
+        Args:
+            start_color: Colour at the top-left corner.
+            end_color: Colour at the bottom-right corner.
+            parent: Optional parent widget.
+        """
+        super().__init__(parent)
+        # Object-relative coordinates so the gradient always spans the frame,
+        # matching qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1) in QSS
+        self.gradient = QLinearGradient(QPointF(0, 0), QPointF(1, 1))
+        self.gradient.setCoordinateMode(QGradient.ObjectMode)
+        self.gradient.setColorAt(0, QColor(start_color))
+        self.gradient.setColorAt(1, QColor(end_color))
+
+    def paintEvent(self, event):
+        """Fill the exposed area with the gradient."""
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self.gradient)
@@ -0,0 +1,169 @@
+from functools import partial
+from PySide6.QtWidgets import QStyledItemDelegate
+from PySide6.QtCore import Qt, QEvent, QModelIndex, QPersistentModelIndex, QRect, QTimer, Signal
+from PySide6.QtGui import QColor, QFont
+
+
+# Roles on an action column's item: the record the buttons act on, and the
+# tuple of button labels to draw for that row
+RECORD_ROLE = Qt.UserRole
+ACTIONS_ROLE = Qt.UserRole + 1
+
+# (colour, hover colour) per button label
+_BUTTON_COLORS = {
+    "Edit": (QColor("#2563eb"), QColor("#1e40af")),
+    "Delete": (QColor("#dc2626"), QColor("#b91c1c")),
+    "Return": (QColor("#16a34a"), QColor("#15803d")),
+}
+
+# Button geometry as the per-row widgets rendered it: the tables pad items by
+# 8px/6px, the old action layout added 8px/3px margins, and the table
+# stylesheet holds buttons at 70x32 with 2px between them
+_CELL_PADDING = (8, 6)
+_BUTTON_WIDTH = 70
+_BUTTON_HEIGHT = 32
+_BUTTON_PITCH = 72
+_BUTTON_TOP = 3
+# Left offset of the first button within the padded cell, by button count
+_FIRST_BUTTON_X = {1: 12}
+_DEFAULT_FIRST_BUTTON_X = 8
+
+
+class RowActionDelegate(QStyledItemDelegate):
+    """
+    Delegate that paints a row's action buttons and reports clicks on them.
+
+    Replaces a widget per row: the buttons are drawn straight into the cell,
+    so filling a table creates one item per row instead of a container,
+    layout and buttons.
+    """
+
+    # (button label, record) for a clicked button
+    action_triggered = Signal(str, object)
+
+    def __init__(self, view):
+        """
+        Initialize the delegate.
+
+        Args:
+            view: Table view whose action column this delegate draws
+        """
+        super().__init__(view)
+        self.view = view
+        # (persistent index of the hovered action cell, button under the pointer)
+        self._hovered = None
+        # Track the pointer so hover changes between and out of cells repaint
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+
+    def _set_hover(self, index, button):
+        """
+        Record the button under the pointer, repainting the cells it left and entered.
+
+        Args:
+            index: Model index of the hovered action cell, or None
+            button: Position of the hovered button in the row's actions, or -1
+        """
+        hovered = None if index is None else (QPersistentModelIndex(index), button)
+        if hovered == self._hovered:
+            return
+        viewport = self.view.viewport()
+        for cell in (self._hovered, hovered):
+            if cell is not None and cell[0].isValid():
+                viewport.update(self.view.visualRect(QModelIndex(cell[0])))
+        self._hovered = hovered
+
+    def eventFilter(self, watched, event):
+        """Follow the pointer over the viewport to keep the hover colour current."""
+        event_type = event.type()
+        if event_type == QEvent.MouseMove:
+            pos = event.position().toPoint()
+            index = self.view.indexAt(pos)
+            if index.isValid() and self.view.itemDelegateForIndex(index) is self:
+                self._set_hover(index, self._button_at(index, self.view.visualRect(index), pos))
+            else:
+                self._set_hover(None, -1)
+        elif event_type == QEvent.Leave:
+            self._set_hover(None, -1)
+        return super().eventFilter(watched, event)
+
+    def _button_rects(self, cell_rect, count):
+        """
+        Lay out action buttons inside a cell.
+
+        Args:
+            cell_rect: Rectangle of the cell
+            count: Number of buttons
+
+        Returns:
+            list: One QRect per button, left to right
+        """
+        x = cell_rect.x() + _CELL_PADDING[0] + _FIRST_BUTTON_X.get(count, _DEFAULT_FIRST_BUTTON_X)
+        y = cell_rect.y() + _CELL_PADDING[1] + _BUTTON_TOP
+        return [
+            QRect(x + i * _BUTTON_PITCH, y, _BUTTON_WIDTH, _BUTTON_HEIGHT)
+            for i in range(count)
+        ]
+
+    def _button_at(self, index, cell_rect, pos):
+        """
+        Find the button under a point.
+
+        Args:
+            index: Model index of the cell
+            cell_rect: Rectangle of the cell
+            pos: Point in viewport coordinates
+
+        Returns:
+            int: Position of the button in the row's actions, or -1 if none
+        """
+        actions = index.data(ACTIONS_ROLE) or ()
+        for i, rect in enumerate(self._button_rects(cell_rect, len(actions))):
+            if rect.contains(pos):
+                return i
+        return -1
+
+    def paint(self, painter, option, index):
+        """Paint the cell background, then the row's buttons."""
+        super().paint(painter, option, index)
+        actions = index.data(ACTIONS_ROLE)
+        if not actions:
+            return
+
+        hovered = -1
+        if self._hovered is not None and self._hovered[0] == index:
+            hovered = self._hovered[1]
+
+        font = QFont(option.font)
+        font.setPixelSize(11)
+        font.setWeight(QFont.DemiBold)
+
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        painter.setFont(font)
+        for i, (label, rect) in enumerate(zip(actions, self._button_rects(option.rect, len(actions)))):
+            color, hover_color = _BUTTON_COLORS.get(label, _BUTTON_COLORS["Edit"])
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(hover_color if i == hovered else color)
+            painter.drawRoundedRect(rect, 5, 5)
+            painter.setPen(Qt.white)
+            painter.drawText(rect, Qt.AlignCenter, label)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        """Emit action_triggered for clicks on a button."""
+        event_type = event.type()
+        if event_type not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease, QEvent.MouseButtonDblClick):
+            return False
+        button = self._button_at(index, option.rect, event.position().toPoint())
+        if button < 0 or event.button() != Qt.LeftButton:
+            return False
+
+        if event_type == QEvent.MouseButtonRelease:
+            label = index.data(ACTIONS_ROLE)[button]
+            record = index.data(RECORD_ROLE)
+            # Emitted from the event loop, so slots may reload the table or
+            # open dialogs without doing so inside this event handler
+            QTimer.singleShot(0, partial(self.action_triggered.emit, label, record))
+        # Presses on a button do not select the row, as with real buttons
+        return True